@@ -0,0 +1,63 @@
+"""Shared frontmatter parsing helpers."""
+
+import re
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
+
+import yaml
+
+FRONTMATTER_CACHE_SIZE = 1024
+
+# libyaml-backed loader/dumper when PyYAML was built with it, pure Python otherwise
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_Dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# Opening fence on the first line, closing fence on its own line; either may carry
+# trailing whitespace or CRLF, and the closing fence may end the file
+_FENCES_RE = re.compile(r"---[ \t]*\r?\n(?:(.*?)\r?\n)??---[ \t]*(?:\r?\n|$)", re.DOTALL)
+
+
+def split_frontmatter(content: str) -> Tuple[Optional[str], str]:
+    """Split note content into its frontmatter block and body.
+
+    Args:
+        content: Full note content
+
+    Returns:
+        (YAML text between the ``---`` fences, body after the closing fence),
+        or (None, content) if the note has no frontmatter
+    """
+    match = _FENCES_RE.match(content)
+    if not match:
+        return None, content
+    return match.group(1) or "", content[match.end():]
+
+
+@lru_cache(maxsize=FRONTMATTER_CACHE_SIZE)
+def _load_frontmatter_block(block: str) -> Dict[str, Any]:
+    frontmatter = yaml.load(block, Loader=_Loader)
+    return frontmatter if isinstance(frontmatter, dict) else {}
+
+
+def parse_frontmatter(block: str) -> Dict[str, Any]:
+    """Parse a YAML frontmatter block into a dictionary.
+
+    Results are cached by the block text, so re-reading an unchanged note
+    skips the YAML parse. A fresh top-level dict is returned on every call
+    so callers can update it without touching the cached value.
+
+    Args:
+        block: YAML text between the opening and closing ``---`` fences
+
+    Returns:
+        Dictionary of frontmatter fields, empty dict if the block is not a mapping
+
+    Raises:
+        yaml.YAMLError: If the block is not valid YAML
+    """
+    return dict(_load_frontmatter_block(block))
+
+
+def dump_frontmatter(frontmatter: Dict[str, Any]) -> str:
+    """Serialize frontmatter fields as a YAML block (without the ``---`` fences)."""
+    return yaml.dump(frontmatter, Dumper=_Dumper, default_flow_style=False, allow_unicode=True)
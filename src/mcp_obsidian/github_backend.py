@@ -5,10 +5,15 @@ import subprocess
 import glob
 import re
 import yaml
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 from datetime import datetime, timedelta
 from .backend import VaultBackend
+from .frontmatter import dump_frontmatter, parse_frontmatter, split_frontmatter
+
+# Upper bound on remembered file existence checks (LRU eviction beyond this)
+FILE_EXISTENCE_CACHE_SIZE = 8192
 
 
 class GitHubBackend(VaultBackend):
@@ -29,7 +34,8 @@ class GitHubBackend(VaultBackend):
         self.vault_path = Path(vault_path).resolve()
         self.github_repo = github_repo
         self.github_token = github_token
-        self._file_existence_cache = {}
+        self._file_existence_cache = OrderedDict()
+        self._resolvable_names = None
         
         # Validate that vault_path exists and is a git repo
         if not self.vault_path.exists():
@@ -139,6 +145,9 @@ class GitHubBackend(VaultBackend):
         file_path = self._get_file_path(filepath)
         file_path.parent.mkdir(parents=True, exist_ok=True)
         file_path.write_text(content, encoding='utf-8')
+        self._invalidate_file_existence(filepath)
+        if self._resolvable_names is not None and filepath.endswith('.md'):
+            self._add_resolvable_names(self._resolvable_names, filepath)
     
     def _list_markdown_files(self, directory: Optional[Path] = None) -> List[Path]:
         """List all markdown files in directory (recursive)."""
@@ -165,24 +174,72 @@ class GitHubBackend(VaultBackend):
     def _file_exists_in_vault(self, filepath: str) -> bool:
         """Check if a file exists in the vault."""
         if filepath in self._file_existence_cache:
+            self._file_existence_cache.move_to_end(filepath)
             return self._file_existence_cache[filepath]
         
+        # Markdown paths are answered by the vault name set
+        if filepath.endswith('.md'):
+            return filepath in self._get_resolvable_names()
+        
         # Try exact path
         file_path = self._get_file_path(filepath)
         if file_path.exists():
-            self._file_existence_cache[filepath] = True
-            return True
+            return self._cache_file_existence(filepath, True)
         
         # If no path separators, search for filename
         if '/' not in filepath:
             search_name = filepath if not filepath.endswith('.md') else filepath[:-3]
             for md_file in self._list_markdown_files():
                 if md_file.stem == search_name or md_file.name == filepath:
-                    self._file_existence_cache[filepath] = True
-                    return True
-        
-        self._file_existence_cache[filepath] = False
-        return False
+                    return self._cache_file_existence(filepath, True)
+        
+        return self._cache_file_existence(filepath, False)
+    
+    def _cache_file_existence(self, filepath: str, exists: bool) -> bool:
+        """Record an existence check, evicting the least recently used entry when full."""
+        self._file_existence_cache[filepath] = exists
+        self._file_existence_cache.move_to_end(filepath)
+        if len(self._file_existence_cache) > FILE_EXISTENCE_CACHE_SIZE:
+            self._file_existence_cache.popitem(last=False)
+        return exists
+    
+    def _get_resolvable_names(self) -> set:
+        """Get every note path and basename, with and without .md."""
+        if self._resolvable_names is None:
+            names = set()
+            for md_file in self._list_markdown_files():
+                self._add_resolvable_names(names, self._get_relative_path(md_file))
+            self._resolvable_names = names
+        return self._resolvable_names
+    
+    @staticmethod
+    def _add_resolvable_names(names: set, filepath: str) -> None:
+        """Add the full path and basename of a note, with and without .md, to names."""
+        for name in (filepath, filepath.split('/')[-1]):
+            names.add(name)
+            if name.endswith('.md'):
+                names.add(name[:-3])
+    
+    def _link_target_exists(self, *candidates: str) -> bool:
+        """Check if any candidate link target (without .md) resolves to a file."""
+        names = self._get_resolvable_names()
+        if any(candidate in names for candidate in candidates):
+            return True
+        # Only notes are listed; targets with another extension (attachments) still need a probe
+        if not any('.' in candidate.split('/')[-1] for candidate in candidates):
+            return False
+        return any(
+            self._file_exists_in_vault(candidate) or self._file_exists_in_vault(candidate + '.md')
+            for candidate in candidates
+        )
+    
+    def _invalidate_file_existence(self, filepath: str) -> None:
+        """Forget cached existence checks that a write or delete of filepath can change."""
+        filename = filepath.split('/')[-1]
+        for key in (filepath, filename):
+            self._file_existence_cache.pop(key, None)
+            if key.endswith('.md'):
+                self._file_existence_cache.pop(key[:-3], None)
     
     def _is_in_code_block(self, content: str, position: int) -> bool:
         """Check if a position in content is inside a code block."""
@@ -208,10 +265,7 @@ class GitHubBackend(VaultBackend):
                 if original_path_clean.endswith('.md'):
                     original_path_clean = original_path_clean[:-3]
                 
-                if (self._file_exists_in_vault(original_path_clean) or 
-                    self._file_exists_in_vault(original_path_clean + '.md') or
-                    self._file_exists_in_vault(normalized_path) or 
-                    self._file_exists_in_vault(normalized_path + '.md')):
+                if self._link_target_exists(original_path_clean, normalized_path):
                     return f"[[{normalized_path}|{display_text}]]"
                 else:
                     return original_link
@@ -226,10 +280,7 @@ class GitHubBackend(VaultBackend):
                 if original_path_clean.endswith('.md'):
                     original_path_clean = original_path_clean[:-3]
                     
-                if (self._file_exists_in_vault(original_path_clean) or 
-                    self._file_exists_in_vault(original_path_clean + '.md') or
-                    self._file_exists_in_vault(normalized_content) or 
-                    self._file_exists_in_vault(normalized_content + '.md')):
+                if self._link_target_exists(original_path_clean, normalized_content):
                     return f"[[{normalized_content}]]"
                 else:
                     return original_link
@@ -254,10 +305,7 @@ class GitHubBackend(VaultBackend):
                 if original_path_clean.endswith('.md'):
                     original_path_clean = original_path_clean[:-3]
                 
-                if (self._file_exists_in_vault(original_path_clean) or 
-                    self._file_exists_in_vault(original_path_clean + '.md') or
-                    self._file_exists_in_vault(normalized_path) or 
-                    self._file_exists_in_vault(normalized_path + '.md')):
+                if self._link_target_exists(original_path_clean, normalized_path):
                     return f"[[{normalized_path}|{display_text}]]"
                 else:
                     return original_link
@@ -272,10 +320,7 @@ class GitHubBackend(VaultBackend):
                 if original_path_clean.endswith('.md'):
                     original_path_clean = original_path_clean[:-3]
                     
-                if (self._file_exists_in_vault(original_path_clean) or 
-                    self._file_exists_in_vault(original_path_clean + '.md') or
-                    self._file_exists_in_vault(normalized_content) or 
-                    self._file_exists_in_vault(normalized_content + '.md')):
+                if self._link_target_exists(original_path_clean, normalized_content):
                     return f"[[{normalized_content}]]"
                 else:
                     return original_link
@@ -312,10 +357,10 @@ class GitHubBackend(VaultBackend):
             
             if self._file_exists_in_vault(path):
                 wiki_link = self._format_as_wiki_link(path)
+                content = content.replace(f'`{path}`', wiki_link)
+                content = content.replace(f'"{path}"', wiki_link)
+                content = content.replace(f"'{path}'", wiki_link)
                 escaped_path = re.escape(path)
-                content = re.sub(rf'`{escaped_path}`', wiki_link, content)
-                content = re.sub(rf'"{escaped_path}"', wiki_link, content)
-                content = re.sub(rf"'{escaped_path}'", wiki_link, content)
                 content = re.sub(
                     rf'(?<!\[\[)(?<!")(?<!\')(?<!`)(?<!\w){escaped_path}(?!\]\])(?!")(?!\')(?!`)(?!\w)',
                     wiki_link,
@@ -327,10 +372,10 @@ class GitHubBackend(VaultBackend):
     def _auto_link_content(self, content: str) -> str:
         """Automatically convert file path mentions to wiki-links."""
         if content.startswith('---\n'):
-            parts = content.split('---\n', 2)
-            if len(parts) >= 3:
-                frontmatter = parts[1]
-                body = parts[2]
+            end = content.find('\n---\n', 3)
+            if end != -1:
+                frontmatter = content[4:end + 1]
+                body = content[end + 5:]
                 normalized_frontmatter = self._normalize_frontmatter_links(frontmatter)
                 processed_body = self._process_body_content(body)
                 return f"---\n{normalized_frontmatter}---\n{processed_body}"
@@ -418,6 +463,8 @@ class GitHubBackend(VaultBackend):
         file_path = self._get_file_path(filepath)
         if file_path.exists():
             file_path.unlink()
+        self._invalidate_file_existence(filepath)
+        self._resolvable_names = None
         return {"success": True, "filepath": filepath}
     
     # ========================================
@@ -489,34 +536,28 @@ class GitHubBackend(VaultBackend):
     
     def get_frontmatter(self, filepath: str) -> Dict[str, Any]:
         """Get frontmatter from a file."""
-        content = self._read_file(filepath)
-        if not content.startswith('---\n'):
-            return {}
-        
-        parts = content.split('---\n', 2)
-        if len(parts) < 3:
+        block, _ = split_frontmatter(self._read_file(filepath))
+        if block is None:
             return {}
         
         try:
-            return yaml.safe_load(parts[1]) or {}
-        except:
+            return parse_frontmatter(block)
+        except yaml.YAMLError:
             return {}
     
     def update_frontmatter(self, filepath: str, updates: Dict[str, Any]) -> None:
         """Update frontmatter fields in a file."""
         content = self._read_file(filepath)
         frontmatter = self.get_frontmatter(filepath)
+        if all(key in frontmatter and frontmatter[key] == value for key, value in updates.items()):
+            return  # Already up to date, skip the rewrite
         frontmatter.update(updates)
         
         # Remove old frontmatter
-        if content.startswith('---\n'):
-            parts = content.split('---\n', 2)
-            body = parts[2] if len(parts) >= 3 else content
-        else:
-            body = content
+        _, body = split_frontmatter(content)
         
         # Write new frontmatter
-        new_frontmatter = yaml.dump(frontmatter, default_flow_style=False, allow_unicode=True)
+        new_frontmatter = dump_frontmatter(frontmatter)
         new_content = f"---\n{new_frontmatter}---\n{body}"
         self._write_file(filepath, new_content)
     
@@ -526,14 +567,9 @@ class GitHubBackend(VaultBackend):
         if field in frontmatter:
             del frontmatter[field]
             
-            content = self._read_file(filepath)
-            if content.startswith('---\n'):
-                parts = content.split('---\n', 2)
-                body = parts[2] if len(parts) >= 3 else content
-            else:
-                body = content
+            _, body = split_frontmatter(self._read_file(filepath))
             
-            new_frontmatter = yaml.dump(frontmatter, default_flow_style=False, allow_unicode=True)
+            new_frontmatter = dump_frontmatter(frontmatter)
             new_content = f"---\n{new_frontmatter}---\n{body}"
             self._write_file(filepath, new_content)
     
@@ -635,6 +671,9 @@ class GitHubBackend(VaultBackend):
         
         # Rename file
         old_file_path.rename(new_file_path)
+        self._invalidate_file_existence(old_path)
+        self._invalidate_file_existence(self._get_relative_path(new_file_path))
+        self._resolvable_names = None
         
         # Update references
         old_name = old_file_path.name
@@ -643,7 +682,7 @@ class GitHubBackend(VaultBackend):
                 content = md_file.read_text(encoding='utf-8')
                 if old_name in content:
                     new_content = content.replace(old_name, new_name)
-                    md_file.write_text(new_content, encoding='utf-8')
+                    self._write_file(self._get_relative_path(md_file), new_content)
             except:
                 pass
     
@@ -694,7 +733,7 @@ class GitHubBackend(VaultBackend):
                 if f'[[{old_name}]]' in content or f'[[{old_path}]]' in content:
                     new_content = content.replace(f'[[{old_name}]]', f'[[{new_name}]]')
                     new_content = new_content.replace(f'[[{old_path}]]', f'[[{new_path}]]')
-                    md_file.write_text(new_content, encoding='utf-8')
+                    self._write_file(self._get_relative_path(md_file), new_content)
                     count += 1
             except:
                 pass
@@ -825,7 +864,7 @@ stage: exploration
             project_path = f"Projects/{project_path}"
         
         if date is None:
-            date = datetime.now().strftime("%Y-%m-%d")
+            date = datetime.now().date().isoformat()
         
         # Format: daily_progress_YYYY_MM_DD.md
         date_formatted = date.replace("-", "_")
@@ -0,0 +1,227 @@
+"""Persistent tag and link index for a vault."""
+
+import json
+import os
+import sqlite3
+import threading
+from typing import Dict, Iterable, List, Tuple
+
+# Bumped whenever the tables below change; older databases are dropped and rebuilt
+SCHEMA_VERSION = 2
+
+_TABLES = ("meta", "files", "tags", "links", "file_masks", "attachment_refs")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS files (path TEXT PRIMARY KEY, mtime REAL);
+CREATE TABLE IF NOT EXISTS tags (tag TEXT, path TEXT, PRIMARY KEY (tag, path));
+CREATE INDEX IF NOT EXISTS tags_path ON tags (path);
+CREATE TABLE IF NOT EXISTS links (source TEXT, target TEXT, PRIMARY KEY (source, target));
+CREATE INDEX IF NOT EXISTS links_target ON links (target);
+CREATE TABLE IF NOT EXISTS file_masks (path TEXT PRIMARY KEY, mask INTEGER);
+CREATE TABLE IF NOT EXISTS attachment_refs (attachment TEXT, source TEXT, PRIMARY KEY (attachment, source));
+CREATE INDEX IF NOT EXISTS attachment_refs_source ON attachment_refs (source);
+"""
+
+# (path, mtime, tags, link targets, embedded attachments) as produced by the backend for one note
+IndexEntry = Tuple[str, float, Iterable[str], Iterable[str], Iterable[str]]
+
+# Number of most common tags given a bit in each note's tag mask
+MASK_TAG_COUNT = 64
+
+
+def _to_signed(mask: int) -> int:
+    """Map an unsigned 64-bit mask onto SQLite's signed INTEGER range."""
+    return mask - (1 << 64) if mask >= 1 << 63 else mask
+
+
+class VaultIndex:
+    """SQLite-backed inverted index of tags and reverse index of links and embeds.
+
+    Rows are keyed by note path and carry the note's modification time, so
+    callers can compare against the vault's current mtimes and re-index only
+    the notes that changed.
+
+    Each note also gets a 64-bit mask over the vault's most common tags
+    (chosen when most of the index is rewritten at once), so match-all tag
+    queries reduce to a bitwise test per note; rarer tags are checked
+    against the tags table.
+    """
+
+    def __init__(self, db_path: str):
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        if self._conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+            with self._conn:
+                for table in _TABLES:
+                    self._conn.execute(f"DROP TABLE IF EXISTS {table}")
+            self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self._conn.executescript(_SCHEMA)
+        self._lock = threading.Lock()  # one connection shared by the backend's worker threads
+        row = self._conn.execute("SELECT value FROM meta WHERE key = 'mask_tags'").fetchone()
+        self._mask_bits = {tag: bit for bit, tag in enumerate(json.loads(row[0]))} if row else {}
+
+    def paths(self) -> set[str]:
+        """Return every indexed note path."""
+        with self._lock:
+            return {row[0] for row in self._conn.execute("SELECT path FROM files")}
+
+    def mtimes(self) -> Dict[str, float]:
+        """Return the modification time each note had when it was indexed."""
+        with self._lock:
+            return dict(self._conn.execute("SELECT path, mtime FROM files"))
+
+    def apply_changes(self, entries: Iterable[IndexEntry], removed: Iterable[str]) -> None:
+        """Re-index changed notes and drop removed ones in one transaction.
+
+        Args:
+            entries: (path, mtime, tags, link targets, attachments) for each added or changed note
+            removed: Paths of notes that no longer exist
+        """
+        with self._lock, self._conn:
+            for path in removed:
+                self._delete(path)
+            changed = 0
+            for entry in entries:
+                self._delete(entry[0])
+                self._insert(*entry)
+                changed += 1
+            # Re-pick the mask tags when most notes were rewritten (e.g. the first sync)
+            total = self._conn.execute("SELECT COUNT(*) FROM files").fetchone()[0]
+            if changed and changed * 2 >= total:
+                self._rebuild_masks()
+
+    def update_file(self, path: str, mtime: float, tags: Iterable[str], targets: Iterable[str],
+                    attachments: Iterable[str]) -> None:
+        """Replace the rows of a single note."""
+        self.apply_changes([(path, mtime, tags, targets, attachments)], ())
+
+    def remove_file(self, path: str) -> None:
+        """Drop a deleted note from the index."""
+        self.apply_changes((), [path])
+
+    def files_with_tags(self, tags: List[str], match_all: bool = False) -> List[str]:
+        """Find notes carrying any (or all) of the given tags.
+
+        Args:
+            tags: Tags to look up (without # prefix)
+            match_all: If True, a note must carry every tag
+
+        Returns:
+            Sorted note paths
+        """
+        unique_tags = sorted(set(tags))
+        if not unique_tags:
+            # Every note trivially has all of no tags, and none has any of them
+            return sorted(self.paths()) if match_all else []
+
+        placeholders = ", ".join("?" * len(unique_tags))
+        if match_all:
+            query_mask = 0
+            tail_tags = []
+            for tag in unique_tags:
+                bit = self._mask_bits.get(tag)
+                if bit is None:
+                    tail_tags.append(tag)
+                else:
+                    query_mask |= 1 << bit
+
+            if query_mask:
+                # Prefilter on the mask, then confirm any tags outside it
+                query_mask = _to_signed(query_mask)
+                query = "SELECT path FROM file_masks WHERE (mask & ?) = ?"
+                params = [query_mask, query_mask]
+                if tail_tags:
+                    tail_placeholders = ", ".join("?" * len(tail_tags))
+                    query += (f" AND path IN (SELECT path FROM tags WHERE tag IN ({tail_placeholders}) "
+                              "GROUP BY path HAVING COUNT(*) = ?)")
+                    params += [*tail_tags, len(tail_tags)]
+                query += " ORDER BY path"
+            else:
+                query = (f"SELECT path FROM tags WHERE tag IN ({placeholders}) "
+                         "GROUP BY path HAVING COUNT(*) = ? ORDER BY path")
+                params = (*unique_tags, len(unique_tags))
+        else:
+            query = f"SELECT DISTINCT path FROM tags WHERE tag IN ({placeholders}) ORDER BY path"
+            params = unique_tags
+
+        with self._lock:
+            return [row[0] for row in self._conn.execute(query, params)]
+
+    def sources_linking_to(self, target: str) -> List[str]:
+        """Find notes that link to the given target key.
+
+        Args:
+            target: Normalized link target (see the backend's link key helper)
+
+        Returns:
+            Sorted paths of the linking notes
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT DISTINCT source FROM links WHERE target = ? ORDER BY source", (target,)
+            )
+            return [row[0] for row in rows]
+
+    def sources_referencing(self, attachment: str) -> List[str]:
+        """Find notes that embed or link to an attachment.
+
+        Args:
+            attachment: Attachment file name, e.g. ``img.png``
+
+        Returns:
+            Sorted paths of the referencing notes
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT source FROM attachment_refs WHERE attachment = ? "
+                "UNION SELECT source FROM links WHERE target = ? ORDER BY source",
+                (attachment, attachment)
+            )
+            return [row[0] for row in rows]
+
+    def _rebuild_masks(self) -> None:
+        """Assign mask bits to the most common tags and recompute every note's mask."""
+        rows = self._conn.execute(
+            "SELECT tag FROM tags GROUP BY tag ORDER BY COUNT(*) DESC, tag LIMIT ?", (MASK_TAG_COUNT,)
+        )
+        mask_tags = [row[0] for row in rows]
+        self._mask_bits = {tag: bit for bit, tag in enumerate(mask_tags)}
+        self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('mask_tags', ?)", (json.dumps(mask_tags),))
+
+        masks = dict.fromkeys((row[0] for row in self._conn.execute("SELECT path FROM files")), 0)
+        for tag, path in self._conn.execute("SELECT tag, path FROM tags").fetchall():
+            bit = self._mask_bits.get(tag)
+            if bit is not None:
+                masks[path] |= 1 << bit
+        self._conn.execute("DELETE FROM file_masks")
+        self._conn.executemany(
+            "INSERT INTO file_masks (path, mask) VALUES (?, ?)",
+            ((path, _to_signed(mask)) for path, mask in masks.items())
+        )
+
+    def _insert(self, path: str, mtime: float, tags: Iterable[str], targets: Iterable[str],
+                attachments: Iterable[str]) -> None:
+        tags = set(tags)
+        mask = 0
+        for tag in tags:
+            bit = self._mask_bits.get(tag)
+            if bit is not None:
+                mask |= 1 << bit
+        self._conn.execute("INSERT OR REPLACE INTO files (path, mtime) VALUES (?, ?)", (path, mtime))
+        self._conn.execute("INSERT OR REPLACE INTO file_masks (path, mask) VALUES (?, ?)", (path, _to_signed(mask)))
+        self._conn.executemany("INSERT OR IGNORE INTO tags (tag, path) VALUES (?, ?)", ((tag, path) for tag in tags))
+        self._conn.executemany("INSERT OR IGNORE INTO links (source, target) VALUES (?, ?)", ((path, target) for target in targets))
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO attachment_refs (attachment, source) VALUES (?, ?)",
+            ((attachment, path) for attachment in attachments)
+        )
+
+    def _delete(self, path: str) -> None:
+        self._conn.execute("DELETE FROM files WHERE path = ?", (path,))
+        self._conn.execute("DELETE FROM tags WHERE path = ?", (path,))
+        self._conn.execute("DELETE FROM file_masks WHERE path = ?", (path,))
+        self._conn.execute("DELETE FROM links WHERE source = ?", (path,))
+        self._conn.execute("DELETE FROM attachment_refs WHERE source = ?", (path,))
@@ -1,23 +1,118 @@
 import requests
+from requests.adapters import HTTPAdapter
 import urllib.parse
+import threading
+import hashlib
 import os
 import re
+import sqlite3
+import time
 import yaml
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, Optional
 from datetime import datetime, timedelta
+from .backend import VaultBackend
+from .frontmatter import dump_frontmatter, parse_frontmatter, split_frontmatter
+from .index import IndexEntry, VaultIndex
+
+# Upper bound on remembered file existence checks (LRU eviction beyond this)
+FILE_EXISTENCE_CACHE_SIZE = 8192
+
+# Seconds before the note names used for auto-linking are listed again, so notes
+# created outside this server become linkable
+RESOLVABLE_NAMES_MAX_AGE = 60.0
+
+# Tag/link index databases live here, one per vault URL
+VAULT_INDEX_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'mcp-obsidian')
+
+# Concurrent note reads when date range/progress queries include content
+DEFAULT_MAX_WORKERS = 16
+try:
+    MAX_WORKERS = max(1, int(os.getenv('OBSIDIAN_MAX_WORKERS', DEFAULT_MAX_WORKERS)))
+except ValueError:
+    # Ignore a malformed override rather than failing at import
+    MAX_WORKERS = DEFAULT_MAX_WORKERS
+
+# Connection pool size for the shared HTTP session (covers parallel batch reads)
+HTTP_POOL_MAXSIZE = max(16, MAX_WORKERS)
+
+# Upper bound on note bodies (and their extracted tags/links) kept for conditional (ETag) re-reads
+CONTENT_CACHE_SIZE = 256
+
+_INLINE_TAG_RE = re.compile(r'#([a-zA-Z][a-zA-Z0-9/_-]*)')
+# Both link styles in one pass: wiki target, or markdown link url
+_LINK_RE = re.compile(r'\[\[(?P<wiki>[^\]|]+)(?:\|[^\]]+)?\]\]|\[[^\]]+\]\((?P<md>[^\)]+)\)')
+_EMBED_RE = re.compile(r'!\[\[([^\]]+)\]\]|!\[[^\]]*\]\(([^)]+)\)')
+
+# Backtick runs split into fences (```) and inline code markers (` or ``)
+_BACKTICK_RUN_RE = re.compile(r'`{1,3}')
+
+def _frontmatter_from_content(content: str) -> Dict[str, Any]:
+    block, _ = split_frontmatter(content)
+    if block is None:
+        return {}
+    try:
+        return parse_frontmatter(block)
+    except yaml.YAMLError:
+        return {}
+
+def _link_target_key(link: str) -> str:
+    """Reduce a link or vault path to the name Obsidian resolves it by.
+    
+    ``[[Note#Heading]]``, ``[x](Folder/Note.md)`` and ``Other/Note.md`` all map
+    to ``Note``; attachments keep their extension (``img.png``).
+    """
+    name = urllib.parse.unquote(link).split('#', 1)[0].rstrip('/').rsplit('/', 1)[-1]
+    return name[:-3] if name.endswith('.md') else name
+
+def _extract_tags(content: str) -> tuple[str, ...]:
+    """Sorted frontmatter and inline tags of a note."""
+    tags = set()
+    
+    frontmatter = _frontmatter_from_content(content)
+    if 'tags' in frontmatter:
+        fm_tags = frontmatter['tags']
+        if isinstance(fm_tags, list):
+            tags.update(str(tag).lstrip('#') for tag in fm_tags)
+        elif isinstance(fm_tags, str):
+            tags.add(fm_tags.lstrip('#'))
+    
+    # Inline tags (e.g., #tag or #nested/tag)
+    tags.update(_INLINE_TAG_RE.findall(content))
+    
+    return tuple(sorted(tags))
+
+def _extract_links(content: str) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """Wiki links and local markdown link targets of a note."""
+    wiki_links = []
+    md_links = []
+    for wiki, url in _LINK_RE.findall(content):
+        if wiki:
+            wiki_links.append(wiki)
+        elif not url.startswith('http'):
+            md_links.append(url)
+    return tuple(wiki_links), tuple(md_links)
+
+def _extract_attachment_refs(content: str) -> frozenset[str]:
+    """Names of the files a note embeds (``![[img.png]]``, ``![alt](dir/img.png)``)."""
+    return frozenset(
+        _link_target_key((wiki or url).split('|', 1)[0])
+        for wiki, url in _EMBED_RE.findall(content)
+    )
 
 class ObsidianAPIBackend(VaultBackend):
     def __init__(
             self, 
             api_key: str,
-            protocol: str = os.getenv('OBSIDIAN_PROTOCOL', 'https').lower(),
-            host: str = str(os.getenv('OBSIDIAN_HOST', '127.0.0.1')),
-            port: int = int(os.getenv('OBSIDIAN_PORT', '27124')),
+            protocol: str = 'https',
+            host: str = '127.0.0.1',
+            port: int = 27124,
             verify_ssl: bool = False,
         ):
         self.api_key = api_key
         
-        if protocol == 'http':
+        if protocol.lower() == 'http':
             self.protocol = 'http'
         else:
             self.protocol = 'https' # Default to https for any other value, including 'https'
@@ -26,7 +121,19 @@ class ObsidianAPIBackend(VaultBackend):
         self.port = port
         self.verify_ssl = verify_ssl
         self.timeout = (3, 6)
-        self._file_existence_cache = {}  # Cache for file existence checks
+        
+        # Reuse one session so keep-alive connections (and TLS sessions) are pooled
+        self._session = requests.Session()
+        self._session.mount(f'{self.protocol}://', HTTPAdapter(pool_connections=1, pool_maxsize=HTTP_POOL_MAXSIZE))
+        
+        self._content_cache = OrderedDict()  # filepath -> (etag, text, {extractor: result}), LRU
+        self._content_cache_lock = threading.Lock()  # batch reads run on worker threads
+        self._file_existence_cache = OrderedDict()  # LRU cache for file existence checks
+        self._resolvable_names = None  # Note paths/basenames, built on first auto-link
+        self._resolvable_names_at = 0.0  # time.monotonic() of the listing they came from
+        self._index = None  # VaultIndex, opened and synced on first tag/backlink query
+        self._index_lock = threading.Lock()  # one sync at a time
+        self._index_dirty = set()  # notes written since the last sync
 
     def get_base_url(self) -> str:
         return f'{self.protocol}://{self.host}:{self.port}'
@@ -52,7 +159,7 @@ class ObsidianAPIBackend(VaultBackend):
         url = f"{self.get_base_url()}/vault/"
         
         def call_fn():
-            response = requests.get(url, headers=self._get_headers(), verify=self.verify_ssl, timeout=self.timeout)
+            response = self._session.get(url, headers=self._get_headers(), verify=self.verify_ssl, timeout=self.timeout)
             response.raise_for_status()
             
             return response.json()['files']
@@ -64,7 +171,7 @@ class ObsidianAPIBackend(VaultBackend):
         url = f"{self.get_base_url()}/vault/{dirpath}/"
         
         def call_fn():
-            response = requests.get(url, headers=self._get_headers(), verify=self.verify_ssl, timeout=self.timeout)
+            response = self._session.get(url, headers=self._get_headers(), verify=self.verify_ssl, timeout=self.timeout)
             response.raise_for_status()
             
             return response.json()['files']
@@ -75,13 +182,47 @@ class ObsidianAPIBackend(VaultBackend):
         url = f"{self.get_base_url()}/vault/{filepath}"
     
         def call_fn():
-            response = requests.get(url, headers=self._get_headers(), verify=self.verify_ssl, timeout=self.timeout)
+            headers = self._get_headers()
+            with self._content_cache_lock:
+                cached = self._content_cache.get(filepath)
+            if cached:
+                headers['If-None-Match'] = cached[0]
+            
+            response = self._session.get(url, headers=headers, verify=self.verify_ssl, timeout=self.timeout)
+            if response.status_code == 304 and cached:
+                with self._content_cache_lock:
+                    if filepath in self._content_cache:
+                        self._content_cache.move_to_end(filepath)
+                return cached[1]
             response.raise_for_status()
             
-            return response.text
+            text = response.text
+            etag = response.headers.get('ETag')
+            if etag:
+                with self._content_cache_lock:
+                    self._content_cache[filepath] = (etag, text, {})
+                    self._content_cache.move_to_end(filepath)
+                    if len(self._content_cache) > CONTENT_CACHE_SIZE:
+                        self._content_cache.popitem(last=False)
+            return text
 
         return self._safe_call(call_fn)
     
+    def _extract(self, filepath: str, content: str, extractor):
+        """Run a tag/link extractor on a note, reusing its result while the body is unchanged.
+        
+        Results are kept with the note's ETag-cached body, so they are evicted
+        together and a body that changed (new ETag, new string) is parsed again.
+        """
+        with self._content_cache_lock:
+            cached = self._content_cache.get(filepath)
+        if cached is None or cached[1] is not content:
+            return extractor(content)
+        results = cached[2]
+        if extractor not in results:
+            results[extractor] = extractor(content)
+        return results[extractor]
+    
     def get_batch_file_contents(self, filepaths: list[str]) -> str:
         """Get contents of multiple files and concatenate them with headers.
         
@@ -111,7 +252,7 @@ class ObsidianAPIBackend(VaultBackend):
         }
         
         def call_fn():
-            response = requests.post(url, headers=self._get_headers(), params=params, verify=self.verify_ssl, timeout=self.timeout)
+            response = self._session.post(url, headers=self._get_headers(), params=params, verify=self.verify_ssl, timeout=self.timeout)
             response.raise_for_status()
             return response.json()
 
@@ -124,7 +265,7 @@ class ObsidianAPIBackend(VaultBackend):
         url = f"{self.get_base_url()}/vault/{filepath}"
         
         def call_fn():
-            response = requests.post(
+            response = self._session.post(
                 url, 
                 headers=self._get_headers() | {'Content-Type': 'text/markdown'}, 
                 data=content,
@@ -134,7 +275,11 @@ class ObsidianAPIBackend(VaultBackend):
             response.raise_for_status()
             return None
 
-        return self._safe_call(call_fn)
+        result = self._safe_call(call_fn)
+        self._invalidate_file_existence(filepath)
+        self._note_written(filepath)
+        self._mark_index_dirty(filepath)
+        return result
     
     def patch_content(self, filepath: str, operation: str, target_type: str, target: str, content: str) -> Any:
         # AUTO-LINK: Process content before patching
@@ -150,11 +295,13 @@ class ObsidianAPIBackend(VaultBackend):
         }
         
         def call_fn():
-            response = requests.patch(url, headers=headers, data=content, verify=self.verify_ssl, timeout=self.timeout)
+            response = self._session.patch(url, headers=headers, data=content, verify=self.verify_ssl, timeout=self.timeout)
             response.raise_for_status()
             return None
 
-        return self._safe_call(call_fn)
+        result = self._safe_call(call_fn)
+        self._mark_index_dirty(filepath)
+        return result
 
     def put_content(self, filepath: str, content: str) -> Any:
         # AUTO-LINK: Process content before writing
@@ -163,7 +310,7 @@ class ObsidianAPIBackend(VaultBackend):
         url = f"{self.get_base_url()}/vault/{filepath}"
         
         def call_fn():
-            response = requests.put(
+            response = self._session.put(
                 url, 
                 headers=self._get_headers() | {'Content-Type': 'text/markdown'}, 
                 data=content,
@@ -173,7 +320,11 @@ class ObsidianAPIBackend(VaultBackend):
             response.raise_for_status()
             return None
 
-        return self._safe_call(call_fn)
+        result = self._safe_call(call_fn)
+        self._invalidate_file_existence(filepath)
+        self._note_written(filepath)
+        self._mark_index_dirty(filepath)
+        return result
     
     def delete_file(self, filepath: str) -> Any:
         """Delete a file or directory from the vault.
@@ -187,11 +338,16 @@ class ObsidianAPIBackend(VaultBackend):
         url = f"{self.get_base_url()}/vault/{filepath}"
         
         def call_fn():
-            response = requests.delete(url, headers=self._get_headers(), verify=self.verify_ssl, timeout=self.timeout)
+            response = self._session.delete(url, headers=self._get_headers(), verify=self.verify_ssl, timeout=self.timeout)
             response.raise_for_status()
             return None
             
-        return self._safe_call(call_fn)
+        result = self._safe_call(call_fn)
+        self._invalidate_file_existence(filepath)
+        # Another note may share the basename, so rebuild the name set lazily
+        self._resolvable_names = None
+        self._mark_index_dirty(filepath)
+        return result
     
     def search_json(self, query: dict) -> Any:
         url = f"{self.get_base_url()}/search/"
@@ -201,7 +357,7 @@ class ObsidianAPIBackend(VaultBackend):
         }
         
         def call_fn():
-            response = requests.post(url, headers=headers, json=query, verify=self.verify_ssl, timeout=self.timeout)
+            response = self._session.post(url, headers=headers, json=query, verify=self.verify_ssl, timeout=self.timeout)
             response.raise_for_status()
             return response.json()
 
@@ -225,7 +381,7 @@ class ObsidianAPIBackend(VaultBackend):
             headers = self._get_headers()
             if type == "metadata":
                 headers['Accept'] = 'application/vnd.olrapi.note+json'
-            response = requests.get(url, headers=headers, verify=self.verify_ssl, timeout=self.timeout)
+            response = self._session.get(url, headers=headers, verify=self.verify_ssl, timeout=self.timeout)
             response.raise_for_status()
             
             return response.text
@@ -251,7 +407,7 @@ class ObsidianAPIBackend(VaultBackend):
         }
         
         def call_fn():
-            response = requests.get(
+            response = self._session.get(
                 url, 
                 headers=self._get_headers(), 
                 params=params,
@@ -285,600 +441,78 @@ class ObsidianAPIBackend(VaultBackend):
         # Get all files
         all_files = self.list_files_in_vault()
         
-        # Filter for periodic notes matching the pattern
-        import re
-        periodic_files = []
-        for filename in all_files:
-            if isinstance(filename, str) and re.search(pattern, filename) and filename.endswith('.md'):
-                periodic_files.append(filename)
-        
-        # Sort by filename (which should sort by date for ISO format)
-        periodic_files.sort(reverse=True)
-        periodic_files = periodic_files[:limit]
-        
-        # Build result
-        results = []
-        for filepath in periodic_files:
-            result = {'path': filepath, 'filename': filepath}
-            if include_content:
-                try:
-                    result['content'] = self.get_file_contents(filepath)
-                except:
-                    result['content'] = None
-            results.append(result)
-        
-        return results
-    
-    def get_recent_changes(self, limit: int = 10, days: int = 90) -> Any:
-        """Get recently modified files in the vault.
-        
-        Args:
-            limit: Maximum number of files to return (default: 10)
-            days: Only include files modified within this many days (default: 90)
-            
-        Returns:
-            List of recently modified files with metadata
-        """
-        # Get all files from vault listing
-        all_files = self.list_files_in_vault()
-        
-        # Filter for markdown files only
-        md_files = [f for f in all_files if isinstance(f, str) and f.endswith('.md')]
-        
-        # Get modification times
-        from datetime import datetime, timedelta
-        cutoff_ts = (datetime.now() - timedelta(days=days)).timestamp()
-        
-        recent_files = []
-        for filepath in md_files[:100]:  # Limit to first 100 to avoid timeout
-            try:
-                # Get file metadata
-                stat_url = f"{self.get_base_url()}/vault/{filepath}"
-                stat_response = requests.get(
-                    stat_url,
-                    headers=self._get_headers(),
-                    verify=self.verify_ssl,
-                    timeout=self.timeout
-                )
-                if stat_response.status_code == 200:
-                    file_info = stat_response.json()
-                    mtime = file_info.get('stat', {}).get('mtime', 0) / 1000  # Convert ms to seconds
-                    
-                    if mtime >= cutoff_ts:
-                        recent_files.append({
-                            'path': filepath,
-                            'filename': filepath.split('/')[-1],
-                            'mtime': mtime,
-                            **file_info
-                        })
-            except:
-                continue
-        
-        # Sort by modification time (most recent first) and limit
-        recent_files.sort(key=lambda x: x.get('mtime', 0), reverse=True)
-        return recent_files[:limit]
-    
-    def get_frontmatter(self, filepath: str) -> Dict[str, Any]:
-        """Extract frontmatter from a file.
-        
-        Args:
-            filepath: Path to the file (relative to vault root)
-            
-        Returns:
-            Dictionary of frontmatter fields, empty dict if no frontmatter
-        """
-        content = self.get_file_contents(filepath)
-        
-        # Match YAML frontmatter (--- at start, --- at end)
-        pattern = r'^---\s*\n(.*?)\n---\s*\n'
-        match = re.match(pattern, content, re.DOTALL)
-        
-        if not match:
-            return {}
-        
-        try:
-            frontmatter = yaml.safe_load(match.group(1))
-            return frontmatter if isinstance(frontmatter, dict) else {}
-        except yaml.YAMLError:
-            return {}
-    
-    def update_frontmatter(self, filepath: str, updates: Dict[str, Any]) -> None:
-        """Update frontmatter fields in a file, merging with existing.
-        
-        Args:
-            filepath: Path to the file (relative to vault root)
-            updates: Dictionary of fields to update
-        """
-        content = self.get_file_contents(filepath)
-        
-        # Extract existing frontmatter and content
-        pattern = r'^---\s*\n(.*?)\n---\s*\n(.*)'
-        match = re.match(pattern, content, re.DOTALL)
-        
-        if match:
-            # File has existing frontmatter
-            try:
-                existing_fm = yaml.safe_load(match.group(1))
-                existing_fm = existing_fm if isinstance(existing_fm, dict) else {}
-            except yaml.YAMLError:
-                existing_fm = {}
-            
-            body_content = match.group(2)
-        else:
-            # No existing frontmatter
-            existing_fm = {}
-            body_content = content
-        
-        # Merge updates
-        existing_fm.update(updates)
-        
-        # Rebuild file content
-        fm_yaml = yaml.dump(existing_fm, default_flow_style=False, allow_unicode=True)
-        new_content = f"---\n{fm_yaml}---\n{body_content}"
-        
-        self.put_content(filepath, new_content)
-    
-    def delete_frontmatter_field(self, filepath: str, field: str) -> None:
-        """Delete a specific field from frontmatter.
-        
-        Args:
-            filepath: Path to the file (relative to vault root)
-            field: Field name to delete
-        """
-        content = self.get_file_contents(filepath)
-        
-        # Extract existing frontmatter and content
-        pattern = r'^---\s*\n(.*?)\n---\s*\n(.*)'
-        match = re.match(pattern, content, re.DOTALL)
-        
-        if not match:
-            # No frontmatter, nothing to delete
-            return
-        
-        try:
-            existing_fm = yaml.safe_load(match.group(1))
-            existing_fm = existing_fm if isinstance(existing_fm, dict) else {}
-        except yaml.YAMLError:
-            return
-        
-        body_content = match.group(2)
-        
-        # Remove the field if it exists
-        if field in existing_fm:
-            del existing_fm[field]
-        
-        # Rebuild file content
-        if existing_fm:
-            fm_yaml = yaml.dump(existing_fm, default_flow_style=False, allow_unicode=True)
-            new_content = f"---\n{fm_yaml}---\n{body_content}"
-        else:
-            # No frontmatter left, just use body
-            new_content = body_content
-        
-        self.put_content(filepath, new_content)
-    
-    def get_all_tags(self) -> list[str]:
-        """Extract all unique tags from the vault.
-        
-        Returns:
-            List of unique tags (without # prefix)
-        """
-        # Use complex search to find all markdown files
-        query = {"glob": ["*.md", {"var": "path"}]}
-        results = self.search_json(query)
-        
-        tags = set()
-        for file_info in results:
-            filepath = file_info.get('path', '')
-            try:
-                # Get tags from this file
-                file_tags = self.get_tags_from_file(filepath)
-                tags.update(file_tags)
-            except:
-                pass
-        
-        return sorted(list(tags))
-    
-    def get_tags_from_file(self, filepath: str) -> list[str]:
-        """Extract tags from a specific file (frontmatter + inline).
-        
-        Args:
-            filepath: Path to the file (relative to vault root)
-            
-        Returns:
-            List of tags (without # prefix)
-        """
-        tags = set()
-        content = self.get_file_contents(filepath)
-        
-        # Get tags from frontmatter
-        frontmatter = self.get_frontmatter(filepath)
-        if 'tags' in frontmatter:
-            fm_tags = frontmatter['tags']
-            if isinstance(fm_tags, list):
-                tags.update(str(tag).lstrip('#') for tag in fm_tags)
-            elif isinstance(fm_tags, str):
-                tags.add(fm_tags.lstrip('#'))
-        
-        # Get inline tags (e.g., #tag or #nested/tag)
-        inline_tag_pattern = r'#([a-zA-Z][a-zA-Z0-9/_-]*)'
-        inline_tags = re.findall(inline_tag_pattern, content)
-        tags.update(inline_tags)
-        
-        return sorted(list(tags))
-    
-    def find_files_by_tags(self, tags: list[str], match_all: bool = False) -> list[str]:
-        """Find files matching tag query.
-        
-        Args:
-            tags: List of tags to search for (without # prefix)
-            match_all: If True, file must have all tags (AND). If False, any tag (OR)
-            
-        Returns:
-            List of file paths matching the tag criteria
-        """
-        # Get all markdown files
-        query = {"glob": ["*.md", {"var": "path"}]}
-        results = self.search_json(query)
-        
-        matching_files = []
-        for file_info in results:
-            filepath = file_info.get('path', '')
-            try:
-                file_tags = set(self.get_tags_from_file(filepath))
-                search_tags = set(tag.lstrip('#') for tag in tags)
-                
-                if match_all:
-                    # All tags must be present
-                    if search_tags.issubset(file_tags):
-                        matching_files.append(filepath)
-                else:
-                    # Any tag can be present
-                    if search_tags.intersection(file_tags):
-                        matching_files.append(filepath)
-            except:
-                pass
-        
-        return matching_files
-    
-    def list_attachments(self, folder_path: str = "attachments") -> list[Dict[str, Any]]:
-        """List all files in attachments folder with metadata.
-        
-        Args:
-            folder_path: Path to attachments folder (default: "attachments")
-            
-        Returns:
-            List of file info dictionaries with path, size, and type
-        """
-        try:
-            files = self.list_files_in_dir(folder_path)
-            attachment_list = []
-            
-            for file_path in files:
-                if file_path.endswith('/'):
-                    continue  # Skip directories
-                    
-                # Get basic file info
-                file_info = {
-                    'path': file_path,
-                    'name': file_path.split('/')[-1],
-                    'extension': file_path.split('.')[-1] if '.' in file_path else ''
-                }
-                attachment_list.append(file_info)
-            
-            return attachment_list
-        except:
-            return []
-    
-    def find_attachment_references(self, filepath: str) -> list[str]:
-        """Find all files that reference a specific attachment.
-        
-        Args:
-            filepath: Path to the attachment file
-            
-        Returns:
-            List of file paths that reference this attachment
-        """
-        filename = filepath.split('/')[-1]
-        # Search for files containing this filename
-        results = self.search(filename, context_length=50)
-        
-        referencing_files = []
-        for result in results:
-            ref_file = result.get('filename', '')
-            if ref_file and ref_file != filepath:
-                referencing_files.append(ref_file)
-        
-        return referencing_files
-    
-    def rename_attachment(self, old_path: str, new_name: str) -> None:
-        """Rename an attachment and update all references.
-        
-        Args:
-            old_path: Current path to the attachment
-            new_name: New filename (without directory path)
-        """
-        # Get directory from old path
-        old_filename = old_path.split('/')[-1]
-        directory = '/'.join(old_path.split('/')[:-1])
-        new_path = f"{directory}/{new_name}" if directory else new_name
-        
-        # Find all files that reference this attachment
-        referencing_files = self.find_attachment_references(old_path)
-        
-        # Get the attachment content
-        try:
-            content = self.get_file_contents(old_path)
-            
-            # Create file with new name
-            self.put_content(new_path, content)
-            
-            # Update all references
-            for ref_file in referencing_files:
-                try:
-                    file_content = self.get_file_contents(ref_file)
-                    # Replace old filename with new filename
-                    updated_content = file_content.replace(old_filename, new_name)
-                    self.put_content(ref_file, updated_content)
-                except:
-                    pass
-            
-            # Delete old file
-            self.delete_file(old_path)
-        except Exception as e:
-            raise Exception(f"Failed to rename attachment: {str(e)}")
-    
-    def get_links_in_file(self, filepath: str) -> Dict[str, list[str]]:
-        """Extract all links from a file.
-        
-        Args:
-            filepath: Path to the file
-            
-        Returns:
-            Dictionary with 'wiki_links' and 'markdown_links' lists
-        """
-        content = self.get_file_contents(filepath)
-        
-        # Wiki-style links: [[Link]] or [[Link|Display]]
-        wiki_pattern = r'\[\[([^\]|]+)(?:\|[^\]]+)?\]\]'
-        wiki_links = re.findall(wiki_pattern, content)
-        
-        # Markdown links: [Display](url)
-        md_pattern = r'\[([^\]]+)\]\(([^\)]+)\)'
-        md_links = re.findall(md_pattern, content)
-        md_links = [url for _, url in md_links if not url.startswith('http')]
-        
-        return {
-            'wiki_links': wiki_links,
-            'markdown_links': md_links
-        }
-    
-    def get_backlinks(self, filepath: str) -> list[str]:
-        """Find all files that link to a specific file.
-        
-        Args:
-            filepath: Path to the target file
-            
-        Returns:
-            List of file paths that link to this file
-        """
-        # Get filename without extension for wiki links
-        filename = filepath.split('/')[-1]
-        basename = filename.rsplit('.', 1)[0] if '.' in filename else filename
-        
-        # Search for references to this file
-        results = self.search(basename, context_length=100)
-        
-        backlinks = []
-        for result in results:
-            ref_file = result.get('filename', '')
-            if ref_file and ref_file != filepath:
-                # Check if it actually contains a link
-                try:
-                    links = self.get_links_in_file(ref_file)
-                    all_links = links['wiki_links'] + links['markdown_links']
-                    if any(basename in link or filepath in link for link in all_links):
-                        backlinks.append(ref_file)
-                except:
-                    pass
-        
-        return list(set(backlinks))
-    
-    def update_links(self, old_path: str, new_path: str) -> int:
-        """Update all links when a file is renamed/moved.
-        
-        Args:
-            old_path: Old file path
-            new_path: New file path
-            
-        Returns:
-            Number of files updated
-        """
-        old_basename = old_path.split('/')[-1].rsplit('.', 1)[0] if '.' in old_path else old_path.split('/')[-1]
-        new_basename = new_path.split('/')[-1].rsplit('.', 1)[0] if '.' in new_path else new_path.split('/')[-1]
+        # Filter for periodic notes matching the pattern
+        import re
+        periodic_files = []
+        for filename in all_files:
+            if isinstance(filename, str) and re.search(pattern, filename) and filename.endswith('.md'):
+                periodic_files.append(filename)
         
-        # Find files that link to the old path
-        backlinks = self.get_backlinks(old_path)
+        # Sort by filename (which should sort by date for ISO format)
+        periodic_files.sort(reverse=True)
+        periodic_files = periodic_files[:limit]
         
-        updated_count = 0
-        for ref_file in backlinks:
-            try:
-                content = self.get_file_contents(ref_file)
-                
-                # Update wiki links
-                content = re.sub(
-                    r'\[\[' + re.escape(old_basename) + r'(\|[^\]]+)?\]\]',
-                    f'[[{new_basename}\\1]]',
-                    content
-                )
-                
-                # Update markdown links
-                content = re.sub(
-                    r'\[([^\]]+)\]\(' + re.escape(old_path) + r'\)',
-                    f'[\\1]({new_path})',
-                    content
-                )
-                
-                self.put_content(ref_file, content)
-                updated_count += 1
-            except:
-                pass
+        # Build result
+        results = []
+        for filepath in periodic_files:
+            result = {'path': filepath, 'filename': filepath}
+            if include_content:
+                try:
+                    result['content'] = self.get_file_contents(filepath)
+                except:
+                    result['content'] = None
+            results.append(result)
         
-        return updated_count
+        return results
     
-    def get_files_by_date_range(
-        self,
-        start_date: Optional[str] = None,
-        end_date: Optional[str] = None,
-        folder_path: str = "",
-        days_back: Optional[int] = None,
-        include_content: bool = False
-    ) -> list[Dict[str, Any]]:
-        """Get files created/modified in date range.
+    def get_recent_changes(self, limit: int = 10, days: int = 90) -> Any:
+        """Get recently modified files in the vault.
         
         Args:
-            start_date: Start date in ISO format (YYYY-MM-DD) or None
-            end_date: End date in ISO format (YYYY-MM-DD) or None
-            folder_path: Filter by folder path (empty string for all)
-            days_back: Alternative to start_date - get files from last N days
-            include_content: Whether to include file content
+            limit: Maximum number of files to return (default: 10)
+            days: Only include files modified within this many days (default: 90)
             
         Returns:
-            List of file info dictionaries
+            List of recently modified files with metadata
         """
-        # Calculate date range
-        if days_back is not None:
-            end_dt = datetime.now()
-            start_dt = end_dt - timedelta(days=days_back)
-        else:
-            start_dt = datetime.fromisoformat(start_date) if start_date else datetime.min
-            end_dt = datetime.fromisoformat(end_date) if end_date else datetime.max
-        
-        # Convert to timestamps for comparison
-        start_ts = start_dt.timestamp()
-        end_ts = end_dt.timestamp()
-        
-        # Get all files from vault
-        if folder_path:
-            all_files = self.list_files_in_dir(folder_path)
-        else:
-            all_files = self.list_files_in_vault()
+        # Get all files from vault listing
+        all_files = self.list_files_in_vault()
         
-        # Filter for markdown files
+        # Filter for markdown files only
         md_files = [f for f in all_files if isinstance(f, str) and f.endswith('.md')]
         
-        # Filter by folder and date
-        filtered_results = []
-        for path in md_files[:50]:  # Limit to avoid timeout
-            # Get file metadata to check modification time
+        # Get modification times
+        from datetime import datetime, timedelta
+        cutoff_ts = (datetime.now() - timedelta(days=days)).timestamp()
+        
+        recent_files = []
+        for filepath in md_files[:100]:  # Limit to first 100 to avoid timeout
             try:
-                stat_url = f"{self.get_base_url()}/vault/{path}"
-                stat_response = requests.get(
+                # Get file metadata
+                stat_url = f"{self.get_base_url()}/vault/{filepath}"
+                stat_response = self._session.get(
                     stat_url,
                     headers=self._get_headers(),
                     verify=self.verify_ssl,
                     timeout=self.timeout
                 )
-                if stat_response.status_code != 200:
-                    continue
-                    
-                file_info = stat_response.json()
-                mtime = file_info.get('stat', {}).get('mtime', 0) / 1000  # Convert ms to seconds
-                
-                # Check if within date range
-                if start_ts <= mtime <= end_ts:
-                    file_data = {
-                        'path': path,
-                        'filename': path.split('/')[-1],
-                        'mtime': mtime,
-                        **file_info
-                    }
-                    
-                    if include_content:
-                        try:
-                            file_data['content'] = self.get_file_contents(path)
-                        except:
-                            file_data['content'] = None
+                if stat_response.status_code == 200:
+                    file_info = stat_response.json()
+                    mtime = file_info.get('stat', {}).get('mtime', 0) / 1000  # Convert ms to seconds
                     
-                    filtered_results.append(file_data)
+                    if mtime >= cutoff_ts:
+                        recent_files.append({
+                            'path': filepath,
+                            'filename': filepath.split('/')[-1],
+                            'mtime': mtime,
+                            **file_info
+                        })
             except:
                 continue
         
-        # Sort by modification time (most recent first)
-        filtered_results.sort(key=lambda x: x.get('mtime', 0), reverse=True)
-        return filtered_results
-    
-    def get_folder_progress(
-        self,
-        folder_path: str,
-        days_back: int = 3,
-        include_content: bool = False
-    ) -> Dict[str, Any]:
-        """Get progress summary for a folder.
-        
-        Args:
-            folder_path: Path to the folder
-            days_back: Number of days to look back
-            include_content: Whether to include file content
-            
-        Returns:
-            Dictionary with progress information
-        """
-        files = self.get_files_by_date_range(
-            folder_path=folder_path,
-            days_back=days_back,
-            include_content=include_content
-        )
-        
-        return {
-            'folder': folder_path,
-            'days_back': days_back,
-            'file_count': len(files),
-            'files': files
-        }
-    
-    def create_folder_structure(
-        self,
-        base_path: str,
-        template: str = "research_project"
-    ) -> Dict[str, Any]:
-        """Create a folder structure from a template.
-        
-        Args:
-            base_path: Base path for the project
-            template: Template name (default: "research_project")
-            
-        Returns:
-            Dictionary with created paths
-        """
-        templates = {
-            "research_project": {
-                "folders": ["Chats", "Research", "Daily Progress"],
-                "files": {
-                    "README.md": "",
-                    "index.md": f"""---
-project: {base_path}
-status: active
-stage: exploration
-mode: thinking
-instructions: |
-  CRITICAL: I am in THINKING mode, not WRITING mode.
-  
-  DO NOT write articles, guides, or drafts for me.
-  Only help me explore and deepen my thinking about this project.
-  
-  Your role is to:
-  - Ask me probing questions to clarify my thoughts
-  - Help me identify patterns and connections
-  - Challenge my assumptions constructively
-  - Suggest areas to explore further
-  - Summarize what I've learned so far
-  - Organize research materials
-  
-  You are my thinking partner, not my ghostwriter.
----
-
-        return self._safe_call(call_fn)
+        # Sort by modification time (most recent first) and limit
+        recent_files.sort(key=lambda x: x.get('mtime', 0), reverse=True)
+        return recent_files[:limit]
     
     def get_frontmatter(self, filepath: str) -> Dict[str, Any]:
         """Extract frontmatter from a file.
@@ -889,20 +523,7 @@ instructions: |
         Returns:
             Dictionary of frontmatter fields, empty dict if no frontmatter
         """
-        content = self.get_file_contents(filepath)
-        
-        # Match YAML frontmatter (--- at start, --- at end)
-        pattern = r'^---\s*\n(.*?)\n---\s*\n'
-        match = re.match(pattern, content, re.DOTALL)
-        
-        if not match:
-            return {}
-        
-        try:
-            frontmatter = yaml.safe_load(match.group(1))
-            return frontmatter if isinstance(frontmatter, dict) else {}
-        except yaml.YAMLError:
-            return {}
+        return _frontmatter_from_content(self.get_file_contents(filepath))
     
     def update_frontmatter(self, filepath: str, updates: Dict[str, Any]) -> None:
         """Update frontmatter fields in a file, merging with existing.
@@ -914,28 +535,27 @@ instructions: |
         content = self.get_file_contents(filepath)
         
         # Extract existing frontmatter and content
-        pattern = r'^---\s*\n(.*?)\n---\s*\n(.*)'
-        match = re.match(pattern, content, re.DOTALL)
+        block, body_content = split_frontmatter(content)
         
-        if match:
+        if block is not None:
             # File has existing frontmatter
             try:
-                existing_fm = yaml.safe_load(match.group(1))
-                existing_fm = existing_fm if isinstance(existing_fm, dict) else {}
+                existing_fm = parse_frontmatter(block)
             except yaml.YAMLError:
                 existing_fm = {}
-            
-            body_content = match.group(2)
         else:
             # No existing frontmatter
             existing_fm = {}
-            body_content = content
+        
+        # Nothing to write if every field already has the requested value
+        if all(key in existing_fm and existing_fm[key] == value for key, value in updates.items()):
+            return
         
         # Merge updates
         existing_fm.update(updates)
         
         # Rebuild file content
-        fm_yaml = yaml.dump(existing_fm, default_flow_style=False, allow_unicode=True)
+        fm_yaml = dump_frontmatter(existing_fm)
         new_content = f"---\n{fm_yaml}---\n{body_content}"
         
         self.put_content(filepath, new_content)
@@ -950,28 +570,26 @@ instructions: |
         content = self.get_file_contents(filepath)
         
         # Extract existing frontmatter and content
-        pattern = r'^---\s*\n(.*?)\n---\s*\n(.*)'
-        match = re.match(pattern, content, re.DOTALL)
+        block, body_content = split_frontmatter(content)
         
-        if not match:
+        if block is None:
             # No frontmatter, nothing to delete
             return
         
         try:
-            existing_fm = yaml.safe_load(match.group(1))
-            existing_fm = existing_fm if isinstance(existing_fm, dict) else {}
+            existing_fm = parse_frontmatter(block)
         except yaml.YAMLError:
             return
         
-        body_content = match.group(2)
+        # Field absent: leave the file untouched
+        if field not in existing_fm:
+            return
         
-        # Remove the field if it exists
-        if field in existing_fm:
-            del existing_fm[field]
+        del existing_fm[field]
         
         # Rebuild file content
         if existing_fm:
-            fm_yaml = yaml.dump(existing_fm, default_flow_style=False, allow_unicode=True)
+            fm_yaml = dump_frontmatter(existing_fm)
             new_content = f"---\n{fm_yaml}---\n{body_content}"
         else:
             # No frontmatter left, just use body
@@ -1010,24 +628,8 @@ instructions: |
         Returns:
             List of tags (without # prefix)
         """
-        tags = set()
-        content = self.get_file_contents(filepath)
-        
-        # Get tags from frontmatter
-        frontmatter = self.get_frontmatter(filepath)
-        if 'tags' in frontmatter:
-            fm_tags = frontmatter['tags']
-            if isinstance(fm_tags, list):
-                tags.update(str(tag).lstrip('#') for tag in fm_tags)
-            elif isinstance(fm_tags, str):
-                tags.add(fm_tags.lstrip('#'))
-        
-        # Get inline tags (e.g., #tag or #nested/tag)
-        inline_tag_pattern = r'#([a-zA-Z][a-zA-Z0-9/_-]*)'
-        inline_tags = re.findall(inline_tag_pattern, content)
-        tags.update(inline_tags)
-        
-        return sorted(list(tags))
+        # One read covers both frontmatter and inline tags
+        return list(self._extract(filepath, self.get_file_contents(filepath), _extract_tags))
     
     def find_files_by_tags(self, tags: list[str], match_all: bool = False) -> list[str]:
         """Find files matching tag query.
@@ -1039,7 +641,11 @@ instructions: |
         Returns:
             List of file paths matching the tag criteria
         """
-        # Get all markdown files
+        index = self._get_index()
+        if index is not None:
+            return index.files_with_tags([tag.lstrip('#') for tag in tags], match_all)
+        
+        # Index unavailable: scan every markdown file
         query = {"glob": ["*.md", {"var": "path"}]}
         results = self.search_json(query)
         
@@ -1101,8 +707,12 @@ instructions: |
         Returns:
             List of file paths that reference this attachment
         """
+        index = self._get_index()
+        if index is not None:
+            return [source for source in index.sources_referencing(_link_target_key(filepath)) if source != filepath]
+        
+        # Index unavailable: search for files containing this filename
         filename = filepath.split('/')[-1]
-        # Search for files containing this filename
         results = self.search(filename, context_length=50)
         
         referencing_files = []
@@ -1159,20 +769,12 @@ instructions: |
         Returns:
             Dictionary with 'wiki_links' and 'markdown_links' lists
         """
-        content = self.get_file_contents(filepath)
-        
-        # Wiki-style links: [[Link]] or [[Link|Display]]
-        wiki_pattern = r'\[\[([^\]|]+)(?:\|[^\]]+)?\]\]'
-        wiki_links = re.findall(wiki_pattern, content)
-        
-        # Markdown links: [Display](url)
-        md_pattern = r'\[([^\]]+)\]\(([^\)]+)\)'
-        md_links = re.findall(md_pattern, content)
-        md_links = [url for _, url in md_links if not url.startswith('http')]
+        # Wiki-style links ([[Link]] or [[Link|Display]]) and local markdown links ([Display](url))
+        wiki_links, md_links = self._extract(filepath, self.get_file_contents(filepath), _extract_links)
         
         return {
-            'wiki_links': wiki_links,
-            'markdown_links': md_links
+            'wiki_links': list(wiki_links),
+            'markdown_links': list(md_links)
         }
     
     def get_backlinks(self, filepath: str) -> list[str]:
@@ -1184,7 +786,11 @@ instructions: |
         Returns:
             List of file paths that link to this file
         """
-        # Get filename without extension for wiki links
+        index = self._get_index()
+        if index is not None:
+            return [source for source in index.sources_linking_to(_link_target_key(filepath)) if source != filepath]
+        
+        # Index unavailable: search for the name and confirm each hit links to it
         filename = filepath.split('/')[-1]
         basename = filename.rsplit('.', 1)[0] if '.' in filename else filename
         
@@ -1219,29 +825,30 @@ instructions: |
         old_basename = old_path.split('/')[-1].rsplit('.', 1)[0] if '.' in old_path else old_path.split('/')[-1]
         new_basename = new_path.split('/')[-1].rsplit('.', 1)[0] if '.' in new_path else new_path.split('/')[-1]
         
-        # Find files that link to the old path
+        # Wiki links by name (keeping any display text) and markdown links by path, in one pass
+        link_re = re.compile(
+            r'\[\[' + re.escape(old_basename) + r'(\|[^\]]+)?\]\]'
+            r'|\[([^\]]+)\]\(' + re.escape(old_path) + r'\)'
+        )
+        
+        def replace(match):
+            if match.group(2) is None:
+                return f'[[{new_basename}{match.group(1) or ""}]]'
+            return f'[{match.group(2)}]({new_path})'
+        
+        # Only the notes linking to the old path are read (from the link index when available);
+        # the rewritten notes are re-indexed on the next query
         backlinks = self.get_backlinks(old_path)
         
         updated_count = 0
         for ref_file in backlinks:
             try:
                 content = self.get_file_contents(ref_file)
+                new_content = link_re.sub(replace, content)
+                if new_content == content:
+                    continue
                 
-                # Update wiki links
-                content = re.sub(
-                    r'\[\[' + re.escape(old_basename) + r'(\|[^\]]+)?\]\]',
-                    f'[[{new_basename}\\1]]',
-                    content
-                )
-                
-                # Update markdown links
-                content = re.sub(
-                    r'\[([^\]]+)\]\(' + re.escape(old_path) + r'\)',
-                    f'[\\1]({new_path})',
-                    content
-                )
-                
-                self.put_content(ref_file, content)
+                self.put_content(ref_file, new_content)
                 updated_count += 1
             except:
                 pass
@@ -1254,7 +861,8 @@ instructions: |
         end_date: Optional[str] = None,
         folder_path: str = "",
         days_back: Optional[int] = None,
-        include_content: bool = False
+        include_content: bool = False,
+        max_workers: Optional[int] = None
     ) -> list[Dict[str, Any]]:
         """Get files created/modified in date range.
         
@@ -1264,6 +872,7 @@ instructions: |
             folder_path: Filter by folder path (empty string for all)
             days_back: Alternative to start_date - get files from last N days
             include_content: Whether to include file content
+            max_workers: Concurrent content reads (default: MAX_WORKERS)
             
         Returns:
             List of file info dictionaries
@@ -1290,7 +899,7 @@ SORT file.mtime DESC
         }
         
         def call_fn():
-            response = requests.post(
+            response = self._session.post(
                 url,
                 headers=headers,
                 data=dql_query.encode('utf-8'),
@@ -1303,19 +912,22 @@ SORT file.mtime DESC
         results = self._safe_call(call_fn)
         
         # Filter by folder if specified
-        filtered_results = []
-        for result in results:
-            path = result.get('path', '')
-            if folder_path and not path.startswith(folder_path):
-                continue
-            
-            if include_content:
+        filtered_results = [
+            result for result in results
+            if not folder_path or result.get('path', '').startswith(folder_path)
+        ]
+        
+        if include_content and filtered_results:
+            def read(result):
                 try:
-                    result['content'] = self.get_file_contents(path)
-                except:
-                    result['content'] = None
+                    return self.get_file_contents(result.get('path', ''))
+                except Exception:
+                    return None
             
-            filtered_results.append(result)
+            workers = min(max_workers or MAX_WORKERS, len(filtered_results))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for result, content in zip(filtered_results, executor.map(read, filtered_results)):
+                    result['content'] = content
         
         return filtered_results
     
@@ -1323,7 +935,8 @@ SORT file.mtime DESC
         self,
         folder_path: str,
         days_back: int = 3,
-        include_content: bool = False
+        include_content: bool = False,
+        max_workers: Optional[int] = None
     ) -> Dict[str, Any]:
         """Get progress summary for a folder.
         
@@ -1331,6 +944,7 @@ SORT file.mtime DESC
             folder_path: Path to the folder
             days_back: Number of days to look back
             include_content: Whether to include file content
+            max_workers: Concurrent content reads (default: MAX_WORKERS)
             
         Returns:
             Dictionary with progress information
@@ -1338,7 +952,8 @@ SORT file.mtime DESC
         files = self.get_files_by_date_range(
             folder_path=folder_path,
             days_back=days_back,
-            include_content=include_content
+            include_content=include_content,
+            max_workers=max_workers
         )
         
         return {
@@ -1454,13 +1069,11 @@ instructions: |
         Returns:
             Path to the created daily progress note
         """
-        from datetime import datetime
-        
         # Use today's date if not provided
         if date is None:
-            date = datetime.now().strftime('%Y-%m-%d')
+            date = datetime.now().date().isoformat()
         
-        # Convert date format from YYYY-MM-DD to YYYY_MM_DD
+        # Convert date format from YYYY-MM-DD to YYYY_MM_DD (no parsing needed)
         date_formatted = date.replace('-', '_')
         
         # Create the file path
@@ -1521,7 +1134,7 @@ tags: [daily-progress, research-planning]
     def _file_exists_in_vault(self, filepath: str) -> bool:
         """Check if a file exists in the vault.
         
-        Uses caching to avoid repeated API calls.
+        Uses a bounded LRU cache to avoid repeated API calls.
         First tries the exact path, then searches by filename if that fails.
         
         Args:
@@ -1532,13 +1145,19 @@ tags: [daily-progress, research-planning]
         """
         # Check cache first
         if filepath in self._file_existence_cache:
+            self._file_existence_cache.move_to_end(filepath)
             return self._file_existence_cache[filepath]
         
+        # Markdown paths are answered by the vault name set when available
+        if filepath.endswith('.md'):
+            names = self._get_resolvable_names()
+            if names is not None:
+                return filepath in names
+        
         # Try to get file contents with exact path
         try:
             self.get_file_contents(filepath)
-            self._file_existence_cache[filepath] = True
-            return True
+            return self._cache_file_existence(filepath, True)
         except:
             pass
         
@@ -1553,13 +1172,173 @@ tags: [daily-progress, research-planning]
                 
                 # Check if we got any results
                 if results and len(results) > 0:
-                    self._file_existence_cache[filepath] = True
-                    return True
+                    return self._cache_file_existence(filepath, True)
             except:
                 pass
         
-        self._file_existence_cache[filepath] = False
-        return False
+        return self._cache_file_existence(filepath, False)
+    
+    def _cache_file_existence(self, filepath: str, exists: bool) -> bool:
+        """Record an existence check, evicting the least recently used entry when full."""
+        self._file_existence_cache[filepath] = exists
+        self._file_existence_cache.move_to_end(filepath)
+        if len(self._file_existence_cache) > FILE_EXISTENCE_CACHE_SIZE:
+            self._file_existence_cache.popitem(last=False)
+        return exists
+    
+    def _list_markdown_mtimes(self) -> Dict[str, float]:
+        """Map every markdown note in the vault to its modification time with a single search call."""
+        results = self.search_json({"and": [{"glob": ["*.md", {"var": "path"}]}, {"var": "stat.mtime"}]})
+        return {
+            r['filename']: r['result'] for r in results
+            if isinstance(r, dict) and r.get('filename') and isinstance(r.get('result'), (int, float))
+        }
+    
+    def _list_markdown_paths(self) -> list[str]:
+        """List the paths of all markdown notes in the vault with a single search call."""
+        results = self.search_json({"glob": ["*.md", {"var": "path"}]})
+        return [r['filename'] for r in results if isinstance(r, dict) and r.get('filename')]
+    
+    def _get_resolvable_names(self) -> Optional[set[str]]:
+        """Get every name a wiki-link can use to reach a note.
+        
+        Contains each note's full path and basename, both with and without
+        the .md extension, so a link resolves with a single set lookup. The
+        vault is listed again once the set is older than RESOLVABLE_NAMES_MAX_AGE.
+        
+        Returns:
+            Set of resolvable names, or None if the vault could not be listed
+        """
+        if (self._resolvable_names is None
+                or time.monotonic() - self._resolvable_names_at > RESOLVABLE_NAMES_MAX_AGE):
+            try:
+                paths = self._list_markdown_paths()
+            except Exception:
+                return None
+            self._set_resolvable_names(paths)
+        
+        return self._resolvable_names
+    
+    def _set_resolvable_names(self, paths) -> None:
+        """Rebuild the resolvable name set from a fresh listing of note paths."""
+        names = set()
+        for path in paths:
+            self._add_resolvable_names(names, path)
+        self._resolvable_names = names
+        self._resolvable_names_at = time.monotonic()
+    
+    @staticmethod
+    def _add_resolvable_names(names: set[str], filepath: str) -> None:
+        """Add the full path and basename of a note, with and without .md, to names."""
+        for name in (filepath, filepath.split('/')[-1]):
+            names.add(name)
+            if name.endswith('.md'):
+                names.add(name[:-3])
+    
+    def _link_target_exists(self, *candidates: str) -> bool:
+        """Check if any candidate link target (without .md) resolves to a file.
+        
+        Args:
+            candidates: Link targets with relative prefixes and .md already stripped
+            
+        Returns:
+            True if one of the candidates exists in the vault
+        """
+        names = self._get_resolvable_names()
+        if names is not None:
+            if any(candidate in names for candidate in candidates):
+                return True
+            # Only notes are listed; targets with another extension (attachments) still need a probe
+            if not any('.' in candidate.split('/')[-1] for candidate in candidates):
+                return False
+        
+        return any(
+            self._file_exists_in_vault(candidate) or self._file_exists_in_vault(candidate + '.md')
+            for candidate in candidates
+        )
+    
+    def _get_index(self) -> Optional[VaultIndex]:
+        """Return the tag/link index, synced with the vault's current notes.
+        
+        Every call lists the vault's note mtimes (one search request) and
+        re-reads only the notes that were added, changed or written through
+        this backend since they were indexed, so edits made in Obsidian are
+        picked up before the query is answered.
+        
+        Returns:
+            The index, or None if the vault or the database is unavailable
+        """
+        with self._index_lock:
+            try:
+                mtimes = self._list_markdown_mtimes()
+            except Exception:
+                return None
+            # The listing is current, so auto-linking can reuse it
+            self._set_resolvable_names(mtimes)
+            
+            index = self._index
+            if index is None:
+                url_hash = hashlib.sha1(self.get_base_url().encode('utf-8')).hexdigest()[:12]
+                try:
+                    index = VaultIndex(os.path.join(VAULT_INDEX_DIR, f'index-{url_hash}.db'))
+                except (sqlite3.Error, OSError):
+                    return None
+                self._index = index
+            
+            indexed = index.mtimes()
+            changed = {path for path, mtime in mtimes.items() if indexed.get(path) != mtime}
+            changed.update(self._index_dirty & mtimes.keys())
+            self._index_dirty.clear()
+            removed = indexed.keys() - mtimes.keys()
+            
+            if changed or removed:
+                entries = self._read_index_entries(changed, mtimes)
+                # Unreadable notes are dropped and retried on the next sync
+                unread = changed - {entry[0] for entry in entries}
+                index.apply_changes(entries, removed | unread)
+            
+            return index
+    
+    def _read_index_entries(self, paths, mtimes: Dict[str, float]) -> list[IndexEntry]:
+        """Fetch notes concurrently and extract their index rows, skipping unreadable ones."""
+        paths = list(paths)
+        if not paths:
+            return []
+        
+        def read(filepath):
+            try:
+                content = self.get_file_contents(filepath)
+            except Exception:
+                return None
+            wiki_links, md_links = self._extract(filepath, content, _extract_links)
+            targets = {_link_target_key(link) for link in wiki_links + md_links}
+            tags = self._extract(filepath, content, _extract_tags)
+            return filepath, mtimes[filepath], tags, targets, self._extract(filepath, content, _extract_attachment_refs)
+        
+        with ThreadPoolExecutor(max_workers=min(HTTP_POOL_MAXSIZE, len(paths))) as executor:
+            return [entry for entry in executor.map(read, paths) if entry is not None]
+    
+    def _mark_index_dirty(self, filepath: str) -> None:
+        """Queue a written or deleted note for re-indexing on the next query."""
+        if filepath.endswith('.md'):
+            self._index_dirty.add(filepath)
+    
+    def _note_written(self, filepath: str) -> None:
+        """Make a newly written note resolvable without rebuilding the name set."""
+        if self._resolvable_names is not None and filepath.endswith('.md'):
+            self._add_resolvable_names(self._resolvable_names, filepath)
+    
+    def _invalidate_file_existence(self, filepath: str) -> None:
+        """Forget cached existence checks that a write or delete of filepath can change.
+        
+        Links are resolved by full path or by bare filename, with or without
+        the .md extension, so all of those keys are dropped.
+        """
+        filename = filepath.split('/')[-1]
+        for key in (filepath, filename):
+            self._file_existence_cache.pop(key, None)
+            if key.endswith('.md'):
+                self._file_existence_cache.pop(key[:-3], None)
     
     def _is_in_code_block(self, content: str, position: int) -> bool:
         """Check if a position in content is inside a code block.
@@ -1571,12 +1350,16 @@ tags: [daily-progress, research-planning]
         Returns:
             True if position is inside a code block, False otherwise
         """
-        # Count code block markers before this position
-        before = content[:position]
-        triple_backticks = before.count('```')
-        
-        # Count single backticks (excluding those in triple backticks)
-        single_backticks = before.count('`') - (triple_backticks * 3)
+        # Count code block markers before this position in a single pass,
+        # without copying the prefix
+        triple_backticks = 0
+        single_backticks = 0
+        for run in _BACKTICK_RUN_RE.findall(content, 0, position):
+            if len(run) == 3:
+                triple_backticks += 1
+            else:
+                # Single backticks (excluding those in triple backticks)
+                single_backticks += len(run)
         
         # If odd number of markers, we're inside a code block
         return (triple_backticks % 2 == 1) or (single_backticks % 2 == 1)
@@ -1619,10 +1402,7 @@ tags: [daily-progress, research-planning]
                 if original_path_clean.endswith('.md'):
                     original_path_clean = original_path_clean[:-3]
                     
-                if (self._file_exists_in_vault(original_path_clean) or 
-                    self._file_exists_in_vault(original_path_clean + '.md') or
-                    self._file_exists_in_vault(normalized_path) or 
-                    self._file_exists_in_vault(normalized_path + '.md')):
+                if self._link_target_exists(original_path_clean, normalized_path):
                     return f"[[{normalized_path}|{display_text}]]"
                 else:
                     # File doesn't exist, return original link unchanged
@@ -1643,10 +1423,7 @@ tags: [daily-progress, research-planning]
                 if original_path_clean.endswith('.md'):
                     original_path_clean = original_path_clean[:-3]
                     
-                if (self._file_exists_in_vault(original_path_clean) or 
-                    self._file_exists_in_vault(original_path_clean + '.md') or
-                    self._file_exists_in_vault(normalized_content) or 
-                    self._file_exists_in_vault(normalized_content + '.md')):
+                if self._link_target_exists(original_path_clean, normalized_content):
                     return f"[[{normalized_content}]]"
                 else:
                     # File doesn't exist, return original link unchanged
@@ -1676,12 +1453,12 @@ tags: [daily-progress, research-planning]
         """
         # Check if content has frontmatter
         if content.startswith('---\n'):
-            # Split frontmatter from content
-            parts = content.split('---\n', 2)
-            if len(parts) >= 3:
-                # parts[0] is empty, parts[1] is frontmatter, parts[2] is content
-                frontmatter = parts[1]
-                body = parts[2]
+            # Locate the closing fence instead of splitting, so the body is sliced once
+            end = content.find('\n---\n', 3)
+            if end != -1:
+                # Frontmatter keeps its trailing newline, body starts after the fence
+                frontmatter = content[4:end + 1]
+                body = content[end + 5:]
                 
                 # Normalize frontmatter links
                 normalized_frontmatter = self._normalize_frontmatter_links(frontmatter)
@@ -1731,10 +1508,7 @@ tags: [daily-progress, research-planning]
                 if original_path_clean.endswith('.md'):
                     original_path_clean = original_path_clean[:-3]
                     
-                if (self._file_exists_in_vault(original_path_clean) or 
-                    self._file_exists_in_vault(original_path_clean + '.md') or
-                    self._file_exists_in_vault(normalized_path) or 
-                    self._file_exists_in_vault(normalized_path + '.md')):
+                if self._link_target_exists(original_path_clean, normalized_path):
                     return f"[[{normalized_path}|{display_text}]]"
                 else:
                     # File doesn't exist, return original link unchanged
@@ -1754,10 +1528,7 @@ tags: [daily-progress, research-planning]
                 if original_path_clean.endswith('.md'):
                     original_path_clean = original_path_clean[:-3]
                     
-                if (self._file_exists_in_vault(original_path_clean) or 
-                    self._file_exists_in_vault(original_path_clean + '.md') or
-                    self._file_exists_in_vault(normalized_content) or 
-                    self._file_exists_in_vault(normalized_content + '.md')):
+                if self._link_target_exists(original_path_clean, normalized_content):
                     return f"[[{normalized_content}]]"
                 else:
                     # File doesn't exist, return original link unchanged
@@ -1816,19 +1587,19 @@ tags: [daily-progress, research-planning]
                 wiki_link = self._format_as_wiki_link(path)
                 
                 # Replace the path with wiki-link
-                # Use word boundaries and negative lookbehind/lookahead to avoid replacing inside quotes initially
-                # But do replace quoted paths and backtick paths
-                escaped_path = re.escape(path)
+                # Backtick and quoted paths are literal matches, so plain str.replace
+                # is enough; only standalone mentions need the boundary-aware regex
                 
                 # Replace backtick versions first (most specific)
-                content = re.sub(rf'`{escaped_path}`', wiki_link, content)
+                content = content.replace(f'`{path}`', wiki_link)
                 
                 # Replace quoted versions
-                content = re.sub(rf'"{escaped_path}"', wiki_link, content)
-                content = re.sub(rf"'{escaped_path}'", wiki_link, content)
+                content = content.replace(f'"{path}"', wiki_link)
+                content = content.replace(f"'{path}'", wiki_link)
                 
                 # Then replace unquoted standalone mentions
                 # Avoid replacing if it's already part of a wiki-link
+                escaped_path = re.escape(path)
                 content = re.sub(
                     rf'(?<!\[\[)(?<!")(?<!\')(?<!`)(?<!\w){escaped_path}(?!\]\])(?!")(?!\')(?!`)(?!\w)',
                     wiki_link,
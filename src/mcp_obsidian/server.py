@@ -1,8 +1,9 @@
 import json
 import logging
 from collections.abc import Sequence
+from dataclasses import dataclass, field
 from functools import lru_cache
-from typing import Any
+from typing import Any, Optional
 import os
 from dotenv import load_dotenv
 from mcp.server import Server
@@ -17,8 +18,6 @@ load_dotenv()
 
 from . import tools
 from .backend import VaultBackend
-from .obsidian import ObsidianAPIBackend
-from .github_backend import GitHubBackend
 
 # Load environment variables
 
@@ -26,41 +25,72 @@ from .github_backend import GitHubBackend
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("mcp-obsidian")
 
+@dataclass(frozen=True, slots=True)
+class Config:
+    """Server settings, read from the environment when the backend is first needed."""
+    mode: str
+    api_key: Optional[str] = field(repr=False)
+    protocol: str
+    host: str
+    port: int
+    vault_path: Optional[str]
+    github_repo: Optional[str]
+    github_token: Optional[str] = field(repr=False)
+
+    @classmethod
+    def from_env(cls) -> "Config":
+        port = os.getenv('OBSIDIAN_PORT', '27124')
+        try:
+            port = int(port)
+        except ValueError:
+            raise ValueError(f"OBSIDIAN_PORT must be an integer, got {port!r}") from None
+        return cls(
+            mode=os.getenv("OBSIDIAN_MODE", "api").lower(),
+            api_key=os.getenv("OBSIDIAN_API_KEY"),
+            protocol=os.getenv('OBSIDIAN_PROTOCOL', 'https'),
+            host=os.getenv('OBSIDIAN_HOST', '127.0.0.1'),
+            port=port,
+            vault_path=os.getenv("VAULT_PATH"),
+            github_repo=os.getenv("GITHUB_REPO"),
+            github_token=os.getenv("GITHUB_TOKEN"),
+        )
+
 # Backend factory
 _backend_instance = None
 
 def get_backend() -> VaultBackend:
-    """Get the configured backend instance (singleton)."""
+    """Get the configured backend instance (singleton).
+
+    Backend modules are imported on first use, so listing tools does not
+    pay for importing requests and sqlite3.
+    """
     global _backend_instance
     
     if _backend_instance is None:
-        obsidian_mode = os.getenv("OBSIDIAN_MODE", "api").lower()
+        config = Config.from_env()
         
-        if obsidian_mode == "github":
+        if config.mode == "github":
             # GitHub mode
-            vault_path = os.getenv("VAULT_PATH")
-            github_repo = os.getenv("GITHUB_REPO")
-            github_token = os.getenv("GITHUB_TOKEN")
-            
-            if not vault_path:
+            if not config.vault_path:
                 raise ValueError("VAULT_PATH required for GitHub mode")
-            if not github_repo:
+            if not config.github_repo:
                 raise ValueError("GITHUB_REPO required for GitHub mode")
             
-            logger.info(f"Initializing GitHub backend: {vault_path}")
-            _backend_instance = GitHubBackend(vault_path, github_repo, github_token)
+            from .github_backend import GitHubBackend
+            logger.info(f"Initializing GitHub backend: {config.vault_path}")
+            _backend_instance = GitHubBackend(config.vault_path, config.github_repo, config.github_token)
         else:
             # API mode (default)
-            api_key = os.getenv("OBSIDIAN_API_KEY")
-            if not api_key:
+            if not config.api_key:
                 raise ValueError(f"OBSIDIAN_API_KEY required for API mode. Working directory: {os.getcwd()}")
             
+            from .obsidian import ObsidianAPIBackend
             logger.info("Initializing Obsidian API backend")
             _backend_instance = ObsidianAPIBackend(
-                api_key=api_key,
-                protocol=os.getenv('OBSIDIAN_PROTOCOL', 'https'),
-                host=os.getenv('OBSIDIAN_HOST', '127.0.0.1'),
-                port=int(os.getenv('OBSIDIAN_PORT', '27124')),
+                api_key=config.api_key,
+                protocol=config.protocol,
+                host=config.host,
+                port=config.port,
                 verify_ssl=False
             )
     
@@ -76,12 +106,15 @@ def add_tool_handler(tool_class: tools.ToolHandler):
     global tool_handlers
 
     tool_handlers[tool_class.name] = tool_class
+    get_tool_descriptions.cache_clear()
+
+@lru_cache(maxsize=1)
+def get_tool_descriptions() -> list[Tool]:
+    """Build the tool list once; descriptions are static after registration."""
+    return [th.get_tool_description() for th in tool_handlers.values()]
 
 def get_tool_handler(name: str) -> tools.ToolHandler | None:
-    if name not in tool_handlers:
-        return None
-    
-    return tool_handlers[name]
+    return tool_handlers.get(name)
 
 add_tool_handler(tools.ListFilesInDirToolHandler())
 add_tool_handler(tools.ListFilesInVaultToolHandler())
@@ -109,7 +142,7 @@ add_tool_handler(tools.DailyProgressNoteToolHandler())
 async def list_tools() -> list[Tool]:
     """List available tools."""
 
-    return [th.get_tool_description() for th in tool_handlers.values()]
+    return get_tool_descriptions()
 
 @app.call_tool()
 async def call_tool(name: str, arguments: Any) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
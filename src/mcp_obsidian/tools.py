@@ -1,4 +1,5 @@
 from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from mcp.types import (
     Tool,
     TextContent,
@@ -7,6 +8,16 @@ from mcp.types import (
 )
 import json
 import os
+import re
+import time
+import yaml
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from .frontmatter import parse_frontmatter, split_frontmatter
 
 # Import get_backend - avoid circular import by importing at runtime
 def get_backend():
@@ -17,6 +28,151 @@ def get_backend():
 TOOL_LIST_FILES_IN_VAULT = "obsidian_list_files_in_vault"
 TOOL_LIST_FILES_IN_DIR = "obsidian_list_files_in_dir"
 
+# Accepted values for periodic note arguments (strings keep the documented order)
+_VALID_PERIODS = frozenset({"daily", "weekly", "monthly", "quarterly", "yearly"})
+_VALID_PERIODS_STR = "daily, weekly, monthly, quarterly, yearly"
+_VALID_TYPES = frozenset({"content", "metadata"})
+_VALID_TYPES_STR = "content, metadata"
+# YYYY-MM-DD, shared by the daily progress schema and its argument check
+_ISO_DATE_PATTERN = "^\\d{4}-\\d{2}-\\d{2}$"
+_ISO_DATE_RE = re.compile(_ISO_DATE_PATTERN)
+
+# Project folders live under this vault prefix; bare names are placed inside it
+_PROJECTS_PREFIX = "Projects/"
+_PROJECTS_PREFIX_LEN = len(_PROJECTS_PREFIX)
+
+def _in_projects(path: str) -> str:
+    """Prepend the Projects/ folder to a path unless it is already there."""
+    return path if path[:_PROJECTS_PREFIX_LEN] == _PROJECTS_PREFIX else _PROJECTS_PREFIX + path
+
+# Upper bound on concurrent reads issued by obsidian_batch_get_file_contents
+_BATCH_MAX_WORKERS = 16
+
+# Tool output is compact JSON; set OBSIDIAN_PRETTY_JSON=1 to indent it for reading
+_PRETTY_JSON = os.getenv("OBSIDIAN_PRETTY_JSON") == "1"
+
+def _json_default(obj):
+    """Serialize values JSON has no type for, e.g. dates parsed from YAML frontmatter."""
+    isoformat = getattr(obj, "isoformat", None)
+    return isoformat() if isoformat is not None else str(obj)
+
+def _dumps(obj) -> str:
+    """Serialize tool output as JSON, using orjson when available."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if _PRETTY_JSON:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option, default=_json_default).decode()
+    if _PRETTY_JSON:
+        return json.dumps(obj, indent=2, ensure_ascii=False, default=_json_default)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False, default=_json_default)
+
+def _text(text: str) -> tuple[TextContent]:
+    """Wrap a tool result string as a single-item text response."""
+    return (TextContent(type="text", text=text),)
+
+def _text_per_item(items) -> tuple[TextContent, ...]:
+    """Serialize each item as its own text block, so large results never become one string."""
+    return tuple(TextContent(type="text", text=_dumps(item)) for item in items)
+
+_SEP = "=" * 80
+# Per-file banner in obsidian_batch_get_file_contents output
+_HEADER_TEMPLATE = f"\n{_SEP}\nFILE: {{fp}}\n{_SEP}"
+
+# Success messages returned by the write tools
+_APPENDED_TEMPLATE = "Successfully appended content to {fp}"
+_PATCHED_TEMPLATE = "Successfully patched content in {fp}"
+_UPLOADED_TEMPLATE = "Successfully uploaded content to {fp}"
+_DELETED_TEMPLATE = "Successfully deleted {fp}"
+_FM_UPDATED_TEMPLATE = "Successfully updated frontmatter in {fp}"
+_FM_FIELD_DELETED_TEMPLATE = "Successfully deleted field '{field}' from {fp}"
+_RENAMED_TEMPLATE = "Successfully renamed {fp} to {new_name}"
+_LINKS_UPDATED_TEMPLATE = "Successfully updated links in {count} files"
+_DAILY_PROGRESS_TEMPLATE = "Created daily progress note: {fp}"
+
+class _TTLCache:
+    """Reuse results of vault-wide reads for a short time.
+
+    Tools run one at a time on the server's event loop, so no locking is
+    needed. invalidate() drops every cached result; write tools call it
+    through _vault_written().
+    """
+
+    def __init__(self, ttl: float):
+        self._ttl = ttl
+        self._entries = {}  # key -> (result, time computed)
+
+    def invalidate(self) -> None:
+        self._entries.clear()
+
+    def call(self, key: tuple, fn):
+        entry = self._entries.get(key)
+        if entry is not None and time.monotonic() - entry[1] < self._ttl:
+            return entry[0]
+        result = fn()
+        self._entries[key] = (result, time.monotonic())
+        return result
+
+# Folder progress is reused only across back-to-back calls
+_progress_cache = _TTLCache(ttl=0.25)
+
+# Vault-wide tag and attachment listings are kept until a tool writes to the
+# vault; the max age bounds staleness from edits made in Obsidian itself
+_LISTING_CACHE_MAX_AGE = 60.0
+_listings = _TTLCache(ttl=_LISTING_CACHE_MAX_AGE)
+
+def _vault_written() -> None:
+    """Forget cached vault-wide results after a tool modifies the vault."""
+    _progress_cache.invalidate()
+    _listings.invalidate()
+
+def _extract_frontmatter(content: str) -> dict:
+    """Parse the frontmatter of already-fetched note content.
+
+    Saves the extra round-trip of a separate get_frontmatter call.
+
+    Args:
+        content: Full note content
+
+    Returns:
+        Dictionary of frontmatter fields, empty dict if there is none or it is invalid
+    """
+    block, _ = split_frontmatter(content)
+    if block is None:
+        return {}
+    try:
+        return parse_frontmatter(block)
+    except yaml.YAMLError:
+        return {}
+
+# Fixed pieces of the instruction header, built once at import time
+_HEADER_TOP = f"{_SEP}\n⚠️  CRITICAL: FRONTMATTER INSTRUCTIONS DETECTED\n{_SEP}"
+_THINKING_BLOCK = (
+    "\n⚠️  YOU ARE IN THINKING MODE - DO NOT CREATE CONTENT!\n"
+    "Your role: Ask questions, explore ideas, organize research.\n"
+    "NOT your role: Write drafts, create outlines, generate artifacts."
+)
+_FOOTER = f"\n{_SEP}\nEND OF INSTRUCTIONS - FOLLOW THEM STRICTLY\n{_SEP}"
+
+def _render_mode(mode) -> str:
+    rendered = f"\n🎯 MODE: {str(mode).upper()}"
+    if mode == 'thinking':
+        rendered += "\n" + _THINKING_BLOCK
+    return rendered
+
+# Header line per displayed frontmatter field, in display order
+_FIELD_RENDER = {
+    'mode': _render_mode,
+    'instructions': lambda value: f"\n📋 INSTRUCTIONS:\n{value}",
+    'ai_instructions': lambda value: f"\n📋 AI INSTRUCTIONS:\n{value}",
+    'behavior': lambda value: f"\n🤖 BEHAVIOR:\n{value}",
+    'stage': lambda value: f"\n📊 STAGE: {value}",
+    'status': lambda value: f"\n📌 STATUS: {value}",
+}
+
+# Frontmatter keys that carry behavioral directives for the assistant
+_INSTRUCTION_KEYS = frozenset({'mode', 'instructions', 'ai_instructions', 'behavior'})
+
 def _format_frontmatter_instructions(frontmatter: dict) -> str:
     """Format frontmatter instructions as a prominent header.
     
@@ -27,426 +183,378 @@ def _format_frontmatter_instructions(frontmatter: dict) -> str:
         Formatted instruction header string, or empty string if no instructions
     """
     # Check for behavioral instructions in frontmatter
-    has_instructions = any(key in frontmatter for key in ['mode', 'instructions', 'ai_instructions', 'behavior'])
-    
-    if not has_instructions:
+    if not frontmatter or _INSTRUCTION_KEYS.isdisjoint(frontmatter):
         return ""
     
-    # Build prominent instruction header
-    instruction_parts = []
-    instruction_parts.append("=" * 80)
-    instruction_parts.append("⚠️  CRITICAL: FRONTMATTER INSTRUCTIONS DETECTED")
-    instruction_parts.append("=" * 80)
-    
-    if 'mode' in frontmatter:
-        mode = frontmatter['mode']
-        instruction_parts.append(f"\n🎯 MODE: {mode.upper()}")
-        
-        if mode == 'thinking':
-            instruction_parts.append("\n⚠️  YOU ARE IN THINKING MODE - DO NOT CREATE CONTENT!")
-            instruction_parts.append("Your role: Ask questions, explore ideas, organize research.")
-            instruction_parts.append("NOT your role: Write drafts, create outlines, generate artifacts.")
-    
-    if 'instructions' in frontmatter:
-        instruction_parts.append(f"\n📋 INSTRUCTIONS:\n{frontmatter['instructions']}")
-    
-    if 'ai_instructions' in frontmatter:
-        instruction_parts.append(f"\n📋 AI INSTRUCTIONS:\n{frontmatter['ai_instructions']}")
-    
-    if 'behavior' in frontmatter:
-        instruction_parts.append(f"\n🤖 BEHAVIOR:\n{frontmatter['behavior']}")
+    # Build prominent instruction header, rendering fields in table order
+    parts = [_HEADER_TOP]
+    parts.extend(render(frontmatter[key]) for key, render in _FIELD_RENDER.items() if key in frontmatter)
+    parts.append(_FOOTER)
     
-    # Add other relevant frontmatter fields
-    if 'stage' in frontmatter:
-        instruction_parts.append(f"\n📊 STAGE: {frontmatter['stage']}")
-    
-    if 'status' in frontmatter:
-        instruction_parts.append(f"\n📌 STATUS: {frontmatter['status']}")
-    
-    instruction_parts.append("\n" + "=" * 80)
-    instruction_parts.append("END OF INSTRUCTIONS - FOLLOW THEM STRICTLY")
-    instruction_parts.append("=" * 80)
-    
-    return "\n".join(instruction_parts)
+    return "\n".join(parts)
 
 class ToolHandler():
+    # Argument names that must be present for run_tool to proceed
+    _REQUIRED: frozenset = frozenset()
+    # Further argument names required by particular values of the "operation" argument
+    _REQUIRED_BY_OPERATION: dict[str, frozenset] = {}
+
     def __init__(self, tool_name: str):
         self.name = tool_name
 
+    def _check_required(self, args: dict) -> None:
+        missing = self._REQUIRED - args.keys()
+        if missing:
+            raise RuntimeError(f"Missing required arguments: {', '.join(sorted(missing))}")
+        operation = args.get("operation")
+        missing = self._REQUIRED_BY_OPERATION.get(operation, frozenset()) - args.keys()
+        if missing:
+            raise RuntimeError(f"Missing required arguments for {operation} operation: {', '.join(sorted(missing))}")
+
     def get_tool_description(self) -> Tool:
         raise NotImplementedError()
 
     def run_tool(self, args: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
         raise NotImplementedError()
     
+_LIST_FILES_IN_VAULT_TOOL = Tool(
+    name=TOOL_LIST_FILES_IN_VAULT,
+    description="Lists all files and directories in the root directory of your Obsidian vault.",
+    inputSchema={
+        "type": "object",
+        "properties": {},
+        "required": []
+    },
+)
+
 class ListFilesInVaultToolHandler(ToolHandler):
     def __init__(self):
         super().__init__(TOOL_LIST_FILES_IN_VAULT)
 
     def get_tool_description(self):
-        return Tool(
-            name=self.name,
-            description="Lists all files and directories in the root directory of your Obsidian vault.",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            },
-        )
+        return _LIST_FILES_IN_VAULT_TOOL
 
     def run_tool(self, args: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
         backend = get_backend()
 
         files = backend.list_files_in_vault()
 
-        return [
-            TextContent(
-                type="text",
-                text=json.dumps(files, indent=2)
-            )
-        ]
+        return _text(_dumps(files))
     
+_LIST_FILES_IN_DIR_TOOL = Tool(
+    name=TOOL_LIST_FILES_IN_DIR,
+    description="Lists all files and directories that exist in a specific Obsidian directory.",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "dirpath": {
+                "type": "string",
+                "description": "Path to list files from (relative to your vault root). Note that empty directories will not be returned."
+            },
+        },
+        "required": ["dirpath"]
+    }
+)
+
 class ListFilesInDirToolHandler(ToolHandler):
+    _REQUIRED = frozenset({"dirpath"})
+
     def __init__(self):
         super().__init__(TOOL_LIST_FILES_IN_DIR)
 
     def get_tool_description(self):
-        return Tool(
-            name=self.name,
-            description="Lists all files and directories that exist in a specific Obsidian directory.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "dirpath": {
-                        "type": "string",
-                        "description": "Path to list files from (relative to your vault root). Note that empty directories will not be returned."
-                    },
-                },
-                "required": ["dirpath"]
-            }
-        )
+        return _LIST_FILES_IN_DIR_TOOL
 
     def run_tool(self, args: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
 
-        if "dirpath" not in args:
-            raise RuntimeError("dirpath argument missing in arguments")
+        self._check_required(args)
 
         backend = get_backend()
 
         files = backend.list_files_in_dir(args["dirpath"])
 
-        return [
-            TextContent(
-                type="text",
-                text=json.dumps(files, indent=2)
-            )
-        ]
+        return _text(_dumps(files))
     
+_GET_FILE_CONTENTS_TOOL = Tool(
+    name="obsidian_get_file_contents",
+    description="Return the content of a single file in your vault. IMPORTANT: If the file contains frontmatter with 'mode', 'instructions', or behavioral directives, these will be prominently displayed at the top of the response. You MUST follow these instructions strictly.",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "filepath": {
+                "type": "string",
+                "description": "Path to the relevant file (relative to your vault root).",
+                "format": "path"
+            },
+        },
+        "required": ["filepath"]
+    }
+)
+
 class GetFileContentsToolHandler(ToolHandler):
+    _REQUIRED = frozenset({"filepath"})
+
     def __init__(self):
-        super().__init__("obsidian_get_file_contents")
+        super().__init__(_GET_FILE_CONTENTS_TOOL.name)
 
     def get_tool_description(self):
-        return Tool(
-            name=self.name,
-            description="Return the content of a single file in your vault. IMPORTANT: If the file contains frontmatter with 'mode', 'instructions', or behavioral directives, these will be prominently displayed at the top of the response. You MUST follow these instructions strictly.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "filepath": {
-                        "type": "string",
-                        "description": "Path to the relevant file (relative to your vault root).",
-                        "format": "path"
-                    },
-                },
-                "required": ["filepath"]
-            }
-        )
+        return _GET_FILE_CONTENTS_TOOL
 
     def run_tool(self, args: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
-        if "filepath" not in args:
-            raise RuntimeError("filepath argument missing in arguments")
+        self._check_required(args)
 
         backend = get_backend()
 
-        content = api.get_file_contents(args["filepath"])
+        content = backend.get_file_contents(args["filepath"])
         
         # Extract and highlight frontmatter instructions
-        try:
-            frontmatter = api.get_frontmatter(args["filepath"])
+        frontmatter = _extract_frontmatter(content)
+        if frontmatter:
             instruction_header = _format_frontmatter_instructions(frontmatter)
             
             if instruction_header:
                 # Combine instructions with content
                 formatted_output = instruction_header + "\n\n" + content
-                return [
-                    TextContent(
-                        type="text",
-                        text=formatted_output
-                    )
-                ]
-        except:
-            # If frontmatter extraction fails, just return content
-            pass
-
-        return [
-            TextContent(
-                type="text",
-                text=content
-            )
-        ]
+                return _text(formatted_output)
+
+        return _text(content)
     
+_SEARCH_TOOL = Tool(
+    name="obsidian_simple_search",
+    description="""Simple search for documents matching a specified text query across all files in the vault. 
+            Use this tool when you want to do a simple text search""",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "query": {
+                "type": "string",
+                "description": "Text to a simple search for in the vault."
+            },
+            "context_length": {
+                "type": "integer",
+                "description": "How much context to return around the matching string (default: 100)",
+                "default": 100
+            }
+        },
+        "required": ["query"]
+    }
+)
+
 class SearchToolHandler(ToolHandler):
+    _REQUIRED = frozenset({"query"})
+
     def __init__(self):
-        super().__init__("obsidian_simple_search")
+        super().__init__(_SEARCH_TOOL.name)
 
     def get_tool_description(self):
-        return Tool(
-            name=self.name,
-            description="""Simple search for documents matching a specified text query across all files in the vault. 
-            Use this tool when you want to do a simple text search""",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "query": {
-                        "type": "string",
-                        "description": "Text to a simple search for in the vault."
-                    },
-                    "context_length": {
-                        "type": "integer",
-                        "description": "How much context to return around the matching string (default: 100)",
-                        "default": 100
-                    }
-                },
-                "required": ["query"]
-            }
-        )
+        return _SEARCH_TOOL
 
     def run_tool(self, args: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
-        if "query" not in args:
-            raise RuntimeError("query argument missing in arguments")
+        self._check_required(args)
 
         context_length = args.get("context_length", 100)
         
         backend = get_backend()
         results = backend.search(args["query"], context_length)
         
-        formatted_results = []
-        for result in results:
-            formatted_matches = []
-            for match in result.get('matches', []):
-                context = match.get('context', '')
-                match_pos = match.get('match', {})
-                start = match_pos.get('start', 0)
-                end = match_pos.get('end', 0)
-                
-                formatted_matches.append({
-                    'context': context,
-                    'match_position': {'start': start, 'end': end}
-                })
-                
-            formatted_results.append({
-                'filename': result.get('filename', ''),
-                'score': result.get('score', 0),
-                'matches': formatted_matches
-            })
-
-        return [
-            TextContent(
-                type="text",
-                text=json.dumps(formatted_results, indent=2)
-            )
-        ]
+        formatted_results = [{
+            'filename': result.get('filename', ''),
+            'score': result.get('score', 0),
+            'matches': [{
+                'context': match.get('context', ''),
+                'match_position': {
+                    'start': (match_pos := match.get('match') or {}).get('start', 0),
+                    'end': match_pos.get('end', 0),
+                },
+            } for match in result.get('matches', ())],
+        } for result in results]
+
+        return _text(_dumps(formatted_results))
     
+_APPEND_CONTENT_TOOL = Tool(
+    name="obsidian_append_content",
+    description="Append content to a new or existing file in the vault.",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "filepath": {
+                "type": "string",
+                "description": "Path to the file (relative to vault root)",
+                "format": "path"
+            },
+            "content": {
+                "type": "string",
+                "description": "Content to append to the file"
+            }
+        },
+        "required": ["filepath", "content"]
+    }
+)
+
 class AppendContentToolHandler(ToolHandler):
+   _REQUIRED = frozenset({"filepath", "content"})
+
    def __init__(self):
-       super().__init__("obsidian_append_content")
+       super().__init__(_APPEND_CONTENT_TOOL.name)
 
    def get_tool_description(self):
-       return Tool(
-           name=self.name,
-           description="Append content to a new or existing file in the vault.",
-           inputSchema={
-               "type": "object",
-               "properties": {
-                   "filepath": {
-                       "type": "string",
-                       "description": "Path to the file (relative to vault root)",
-                       "format": "path"
-                   },
-                   "content": {
-                       "type": "string",
-                       "description": "Content to append to the file"
-                   }
-               },
-               "required": ["filepath", "content"]
-           }
-       )
+       return _APPEND_CONTENT_TOOL
 
    def run_tool(self, args: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
-       if "filepath" not in args or "content" not in args:
-           raise RuntimeError("filepath and content arguments required")
+       self._check_required(args)
 
+       filepath = args["filepath"]
        backend = get_backend()
-       backend.append_content(args.get("filepath", ""), args["content"])
-
-       return [
-           TextContent(
-               type="text",
-               text=f"Successfully appended content to {args['filepath']}"
-           )
-       ]
+       backend.append_content(filepath, args["content"])
+       _vault_written()
+
+       return _text(_APPENDED_TEMPLATE.format(fp=filepath))
    
+_PATCH_CONTENT_TOOL = Tool(
+    name="obsidian_patch_content",
+    description="Insert content into an existing note relative to a heading, block reference, or frontmatter field.",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "filepath": {
+                "type": "string",
+                "description": "Path to the file (relative to vault root)",
+                "format": "path"
+            },
+            "operation": {
+                "type": "string",
+                "description": "Operation to perform (append, prepend, or replace)",
+                "enum": ["append", "prepend", "replace"]
+            },
+            "target_type": {
+                "type": "string",
+                "description": "Type of target to patch",
+                "enum": ["heading", "block", "frontmatter"]
+            },
+            "target": {
+                "type": "string", 
+                "description": "Target identifier (heading path, block reference, or frontmatter field)"
+            },
+            "content": {
+                "type": "string",
+                "description": "Content to insert"
+            }
+        },
+        "required": ["filepath", "operation", "target_type", "target", "content"]
+    }
+)
+
 class PatchContentToolHandler(ToolHandler):
+   _REQUIRED = frozenset({"filepath", "operation", "target_type", "target", "content"})
+
    def __init__(self):
-       super().__init__("obsidian_patch_content")
+       super().__init__(_PATCH_CONTENT_TOOL.name)
 
    def get_tool_description(self):
-       return Tool(
-           name=self.name,
-           description="Insert content into an existing note relative to a heading, block reference, or frontmatter field.",
-           inputSchema={
-               "type": "object",
-               "properties": {
-                   "filepath": {
-                       "type": "string",
-                       "description": "Path to the file (relative to vault root)",
-                       "format": "path"
-                   },
-                   "operation": {
-                       "type": "string",
-                       "description": "Operation to perform (append, prepend, or replace)",
-                       "enum": ["append", "prepend", "replace"]
-                   },
-                   "target_type": {
-                       "type": "string",
-                       "description": "Type of target to patch",
-                       "enum": ["heading", "block", "frontmatter"]
-                   },
-                   "target": {
-                       "type": "string", 
-                       "description": "Target identifier (heading path, block reference, or frontmatter field)"
-                   },
-                   "content": {
-                       "type": "string",
-                       "description": "Content to insert"
-                   }
-               },
-               "required": ["filepath", "operation", "target_type", "target", "content"]
-           }
-       )
+       return _PATCH_CONTENT_TOOL
 
    def run_tool(self, args: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
-       if not all(k in args for k in ["filepath", "operation", "target_type", "target", "content"]):
-           raise RuntimeError("filepath, operation, target_type, target and content arguments required")
+       self._check_required(args)
 
+       filepath = args["filepath"]
        backend = get_backend()
        backend.patch_content(
-           args.get("filepath", ""),
-           args.get("operation", ""),
-           args.get("target_type", ""),
-           args.get("target", ""),
-           args.get("content", "")
+           filepath,
+           args["operation"],
+           args["target_type"],
+           args["target"],
+           args["content"]
        )
+       _vault_written()
 
-       return [
-           TextContent(
-               type="text",
-               text=f"Successfully patched content in {args['filepath']}"
-           )
-       ]
+       return _text(_PATCHED_TEMPLATE.format(fp=filepath))
        
+_PUT_CONTENT_TOOL = Tool(
+    name="obsidian_put_content",
+    description="Create a new file in your vault or update the content of an existing one in your vault.",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "filepath": {
+                "type": "string",
+                "description": "Path to the relevant file (relative to your vault root)",
+                "format": "path"
+            },
+            "content": {
+                "type": "string",
+                "description": "Content of the file you would like to upload"
+            }
+        },
+        "required": ["filepath", "content"]
+    }
+)
+
 class PutContentToolHandler(ToolHandler):
+   _REQUIRED = frozenset({"filepath", "content"})
+
    def __init__(self):
-       super().__init__("obsidian_put_content")
+       super().__init__(_PUT_CONTENT_TOOL.name)
 
    def get_tool_description(self):
-       return Tool(
-           name=self.name,
-           description="Create a new file in your vault or update the content of an existing one in your vault.",
-           inputSchema={
-               "type": "object",
-               "properties": {
-                   "filepath": {
-                       "type": "string",
-                       "description": "Path to the relevant file (relative to your vault root)",
-                       "format": "path"
-                   },
-                   "content": {
-                       "type": "string",
-                       "description": "Content of the file you would like to upload"
-                   }
-               },
-               "required": ["filepath", "content"]
-           }
-       )
+       return _PUT_CONTENT_TOOL
 
    def run_tool(self, args: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
-       if "filepath" not in args or "content" not in args:
-           raise RuntimeError("filepath and content arguments required")
+       self._check_required(args)
 
+       filepath = args["filepath"]
        backend = get_backend()
-       backend.put_content(args.get("filepath", ""), args["content"])
-
-       return [
-           TextContent(
-               type="text",
-               text=f"Successfully uploaded content to {args['filepath']}"
-           )
-       ]
+       backend.put_content(filepath, args["content"])
+       _vault_written()
+
+       return _text(_UPLOADED_TEMPLATE.format(fp=filepath))
    
 
+_DELETE_FILE_TOOL = Tool(
+    name="obsidian_delete_file",
+    description="Delete a file or directory from the vault.",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "filepath": {
+                "type": "string",
+                "description": "Path to the file or directory to delete (relative to vault root)",
+                "format": "path"
+            },
+            "confirm": {
+                "type": "boolean",
+                "description": "Confirmation to delete the file (must be true)",
+                "default": False
+            }
+        },
+        "required": ["filepath", "confirm"]
+    }
+)
+
 class DeleteFileToolHandler(ToolHandler):
+   _REQUIRED = frozenset({"filepath"})
+
    def __init__(self):
-       super().__init__("obsidian_delete_file")
+       super().__init__(_DELETE_FILE_TOOL.name)
 
    def get_tool_description(self):
-       return Tool(
-           name=self.name,
-           description="Delete a file or directory from the vault.",
-           inputSchema={
-               "type": "object",
-               "properties": {
-                   "filepath": {
-                       "type": "string",
-                       "description": "Path to the file or directory to delete (relative to vault root)",
-                       "format": "path"
-                   },
-                   "confirm": {
-                       "type": "boolean",
-                       "description": "Confirmation to delete the file (must be true)",
-                       "default": False
-                   }
-               },
-               "required": ["filepath", "confirm"]
-           }
-       )
+       return _DELETE_FILE_TOOL
 
    def run_tool(self, args: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
-       if "filepath" not in args:
-           raise RuntimeError("filepath argument missing in arguments")
+       self._check_required(args)
        
        if not args.get("confirm", False):
            raise RuntimeError("confirm must be set to true to delete a file")
 
+       filepath = args["filepath"]
        backend = get_backend()
-       backend.delete_file(args["filepath"])
-
-       return [
-           TextContent(
-               type="text",
-               text=f"Successfully deleted {args['filepath']}"
-           )
-       ]
-   
-class ComplexSearchToolHandler(ToolHandler):
-   def __init__(self):
-       super().__init__("obsidian_complex_search")
+       backend.delete_file(filepath)
+       _vault_written()
 
-   def get_tool_description(self):
-       return Tool(
-           name=self.name,
-           description="""Complex search for documents using a JsonLogic query. 
+       return _text(_DELETED_TEMPLATE.format(fp=filepath))
+   
+_COMPLEX_SEARCH_TOOL = Tool(
+    name="obsidian_complex_search",
+    description="""Complex search for documents using a JsonLogic query. 
            Supports standard JsonLogic operators plus 'glob' and 'regexp' for pattern matching. Results must be non-falsy.
 
            Use this tool when you want to do a complex search, e.g. for all documents with certain tags etc.
@@ -473,204 +581,181 @@ class ComplexSearchToolHandler(ToolHandler):
               ]
             }
            """,
-           inputSchema={
-               "type": "object",
-               "properties": {
-                   "query": {
-                       "type": "object",
-                       "description": "JsonLogic query object. ALWAYS follow query syntax in examples. \
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "query": {
+                "type": "object",
+                "description": "JsonLogic query object. ALWAYS follow query syntax in examples. \
                             Example 1: {\"glob\": [\"*.md\", {\"var\": \"path\"}]} matches all markdown files \
                             Example 2: {\"and\": [{\"glob\": [\"*.md\", {\"var\": \"path\"}]}, {\"regexp\": [\".*1221.*\", {\"var\": \"content\"}]}]} matches all markdown files with 1221 substring inside them \
                             Example 3: {\"and\": [{\"glob\": [\"*.md\", {\"var\": \"path\"}]}, {\"regexp\": [\".*Work.*\", {\"var\": \"path\"}]}, {\"regexp\": [\"Keaton\", {\"var\": \"content\"}]}]} matches all markdown files in Work folder containing name Keaton \
                         "
-                   }
-               },
-               "required": ["query"]
-           }
-       )
+            }
+        },
+        "required": ["query"]
+    }
+)
+
+class ComplexSearchToolHandler(ToolHandler):
+   _REQUIRED = frozenset({"query"})
+
+   def __init__(self):
+       super().__init__(_COMPLEX_SEARCH_TOOL.name)
+
+   def get_tool_description(self):
+       return _COMPLEX_SEARCH_TOOL
 
    def run_tool(self, args: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
-       if "query" not in args:
-           raise RuntimeError("query argument missing in arguments")
+       self._check_required(args)
 
        backend = get_backend()
-       results = backend.search_json(args.get("query", ""))
-
-       return [
-           TextContent(
-               type="text",
-               text=json.dumps(results, indent=2)
-           )
-       ]
+       results = backend.search_json(args["query"])
+
+       return _text(_dumps(results))
+
+_BATCH_GET_FILE_CONTENTS_TOOL = Tool(
+    name="obsidian_batch_get_file_contents",
+    description="Return the contents of multiple files in your vault, one text block per file, each with a header. IMPORTANT: If any file contains frontmatter with 'mode', 'instructions', or behavioral directives, these will be prominently displayed for that file. You MUST follow these instructions strictly.",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "filepaths": {
+                "type": "array",
+                "items": {
+                    "type": "string",
+                    "description": "Path to a file (relative to your vault root)",
+                    "format": "path"
+                },
+                "description": "List of file paths to read"
+            },
+        },
+        "required": ["filepaths"]
+    }
+)
 
 class BatchGetFileContentsToolHandler(ToolHandler):
+    _REQUIRED = frozenset({"filepaths"})
+
     def __init__(self):
-        super().__init__("obsidian_batch_get_file_contents")
+        super().__init__(_BATCH_GET_FILE_CONTENTS_TOOL.name)
 
     def get_tool_description(self):
-        return Tool(
-            name=self.name,
-            description="Return the contents of multiple files in your vault, concatenated with headers. IMPORTANT: If any file contains frontmatter with 'mode', 'instructions', or behavioral directives, these will be prominently displayed for that file. You MUST follow these instructions strictly.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "filepaths": {
-                        "type": "array",
-                        "items": {
-                            "type": "string",
-                            "description": "Path to a file (relative to your vault root)",
-                            "format": "path"
-                        },
-                        "description": "List of file paths to read"
-                    },
-                },
-                "required": ["filepaths"]
-            }
-        )
+        return _BATCH_GET_FILE_CONTENTS_TOOL
 
     def run_tool(self, args: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
-        if "filepaths" not in args:
-            raise RuntimeError("filepaths argument missing in arguments")
+        self._check_required(args)
 
-        api = obsidian.Obsidian(api_key=api_key, host=obsidian_host)
-        
-        # Process each file individually to extract frontmatter instructions
-        all_contents = []
-        for filepath in args["filepaths"]:
+        backend = get_backend()
+        filepaths = args["filepaths"]
+
+        def fetch(filepath):
+            header = _HEADER_TEMPLATE.format(fp=filepath)
             try:
-                content = api.get_file_contents(filepath)
-                
-                # Try to extract frontmatter instructions
-                try:
-                    frontmatter = api.get_frontmatter(filepath)
-                    instruction_header = _format_frontmatter_instructions(frontmatter)
-                    
-                    if instruction_header:
-                        # Add file header with instructions
-                        all_contents.append(f"\n{'=' * 80}")
-                        all_contents.append(f"FILE: {filepath}")
-                        all_contents.append('=' * 80)
-                        all_contents.append(instruction_header)
-                        all_contents.append(content)
-                    else:
-                        # Add file header without instructions
-                        all_contents.append(f"\n{'=' * 80}")
-                        all_contents.append(f"FILE: {filepath}")
-                        all_contents.append('=' * 80)
-                        all_contents.append(content)
-                except:
-                    # If frontmatter extraction fails, just add content with header
-                    all_contents.append(f"\n{'=' * 80}")
-                    all_contents.append(f"FILE: {filepath}")
-                    all_contents.append('=' * 80)
-                    all_contents.append(content)
+                content = backend.get_file_contents(filepath)
             except Exception as e:
-                all_contents.append(f"\n{'=' * 80}")
-                all_contents.append(f"FILE: {filepath}")
-                all_contents.append('=' * 80)
-                all_contents.append(f"Error reading file: {str(e)}")
-        
-        combined_content = "\n".join(all_contents)
-
-        return [
-            TextContent(
-                type="text",
-                text=combined_content
-            )
-        ]
+                return f"{header}\nError reading file: {str(e)}"
+            instruction_header = _format_frontmatter_instructions(_extract_frontmatter(content))
+            if instruction_header:
+                return f"{header}\n{instruction_header}\n{content}"
+            return f"{header}\n{content}"
+
+        # Each file becomes its own text block, formatted on the worker that read it
+        if not filepaths:
+            return ()
+        with ThreadPoolExecutor(max_workers=min(_BATCH_MAX_WORKERS, len(filepaths))) as executor:
+            return tuple(TextContent(type="text", text=block) for block in executor.map(fetch, filepaths))
+
+_PERIODIC_NOTES_TOOL = Tool(
+    name="obsidian_get_periodic_note",
+    description="Get current periodic note for the specified period.",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "period": {
+                "type": "string",
+                "description": "The period type (daily, weekly, monthly, quarterly, yearly)",
+                "enum": ["daily", "weekly", "monthly", "quarterly", "yearly"]
+            },
+            "type": {
+                "type": "string",
+                "description": "The type of data to get ('content' or 'metadata'). 'content' returns just the content in Markdown format. 'metadata' includes note metadata (including paths, tags, etc.) and the content.",
+                "default": "content",
+                "enum": ["content", "metadata"]
+            }
+        },
+        "required": ["period"]
+    }
+)
 
 class PeriodicNotesToolHandler(ToolHandler):
+    _REQUIRED = frozenset({"period"})
+
     def __init__(self):
-        super().__init__("obsidian_get_periodic_note")
+        super().__init__(_PERIODIC_NOTES_TOOL.name)
 
     def get_tool_description(self):
-        return Tool(
-            name=self.name,
-            description="Get current periodic note for the specified period.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "period": {
-                        "type": "string",
-                        "description": "The period type (daily, weekly, monthly, quarterly, yearly)",
-                        "enum": ["daily", "weekly", "monthly", "quarterly", "yearly"]
-                    },
-                    "type": {
-                        "type": "string",
-                        "description": "The type of data to get ('content' or 'metadata'). 'content' returns just the content in Markdown format. 'metadata' includes note metadata (including paths, tags, etc.) and the content.",
-                        "default": "content",
-                        "enum": ["content", "metadata"]
-                    }
-                },
-                "required": ["period"]
-            }
-        )
+        return _PERIODIC_NOTES_TOOL
 
     def run_tool(self, args: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
-        if "period" not in args:
-            raise RuntimeError("period argument missing in arguments")
+        self._check_required(args)
 
         period = args["period"]
-        valid_periods = ["daily", "weekly", "monthly", "quarterly", "yearly"]
-        if period not in valid_periods:
-            raise RuntimeError(f"Invalid period: {period}. Must be one of: {', '.join(valid_periods)}")
+        if period not in _VALID_PERIODS:
+            raise RuntimeError(f"Invalid period: {period}. Must be one of: {_VALID_PERIODS_STR}")
         
         type = args["type"] if "type" in args else "content"
-        valid_types = ["content", "metadata"]
-        if type not in valid_types:
-            raise RuntimeError(f"Invalid type: {type}. Must be one of: {', '.join(valid_types)}")
+        if type not in _VALID_TYPES:
+            raise RuntimeError(f"Invalid type: {type}. Must be one of: {_VALID_TYPES_STR}")
 
         backend = get_backend()
         content = backend.get_periodic_note(period,type)
 
-        return [
-            TextContent(
-                type="text",
-                text=content
-            )
-        ]
+        return _text(content)
         
+_RECENT_PERIODIC_NOTES_TOOL = Tool(
+    name="obsidian_get_recent_periodic_notes",
+    description="Get most recent periodic notes for the specified period type.",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "period": {
+                "type": "string",
+                "description": "The period type (daily, weekly, monthly, quarterly, yearly)",
+                "enum": ["daily", "weekly", "monthly", "quarterly", "yearly"]
+            },
+            "limit": {
+                "type": "integer",
+                "description": "Maximum number of notes to return (default: 5)",
+                "default": 5,
+                "minimum": 1,
+                "maximum": 50
+            },
+            "include_content": {
+                "type": "boolean",
+                "description": "Whether to include note content (default: false)",
+                "default": False
+            }
+        },
+        "required": ["period"]
+    }
+)
+
 class RecentPeriodicNotesToolHandler(ToolHandler):
+    _REQUIRED = frozenset({"period"})
+
     def __init__(self):
-        super().__init__("obsidian_get_recent_periodic_notes")
+        super().__init__(_RECENT_PERIODIC_NOTES_TOOL.name)
 
     def get_tool_description(self):
-        return Tool(
-            name=self.name,
-            description="Get most recent periodic notes for the specified period type.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "period": {
-                        "type": "string",
-                        "description": "The period type (daily, weekly, monthly, quarterly, yearly)",
-                        "enum": ["daily", "weekly", "monthly", "quarterly", "yearly"]
-                    },
-                    "limit": {
-                        "type": "integer",
-                        "description": "Maximum number of notes to return (default: 5)",
-                        "default": 5,
-                        "minimum": 1,
-                        "maximum": 50
-                    },
-                    "include_content": {
-                        "type": "boolean",
-                        "description": "Whether to include note content (default: false)",
-                        "default": False
-                    }
-                },
-                "required": ["period"]
-            }
-        )
+        return _RECENT_PERIODIC_NOTES_TOOL
 
     def run_tool(self, args: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
-        if "period" not in args:
-            raise RuntimeError("period argument missing in arguments")
+        self._check_required(args)
 
         period = args["period"]
-        valid_periods = ["daily", "weekly", "monthly", "quarterly", "yearly"]
-        if period not in valid_periods:
-            raise RuntimeError(f"Invalid period: {period}. Must be one of: {', '.join(valid_periods)}")
+        if period not in _VALID_PERIODS:
+            raise RuntimeError(f"Invalid period: {period}. Must be one of: {_VALID_PERIODS_STR}")
 
         limit = args.get("limit", 5)
         if not isinstance(limit, int) or limit < 1:
@@ -683,40 +768,37 @@ class RecentPeriodicNotesToolHandler(ToolHandler):
         backend = get_backend()
         results = backend.get_recent_periodic_notes(period, limit, include_content)
 
-        return [
-            TextContent(
-                type="text",
-                text=json.dumps(results, indent=2)
-            )
-        ]
+        return _text(_dumps(results))
         
+_RECENT_CHANGES_TOOL = Tool(
+    name="obsidian_get_recent_changes",
+    description="Get recently modified files in the vault.",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "limit": {
+                "type": "integer",
+                "description": "Maximum number of files to return (default: 10)",
+                "default": 10,
+                "minimum": 1,
+                "maximum": 100
+            },
+            "days": {
+                "type": "integer",
+                "description": "Only include files modified within this many days (default: 90)",
+                "minimum": 1,
+                "default": 90
+            }
+        }
+    }
+)
+
 class RecentChangesToolHandler(ToolHandler):
     def __init__(self):
-        super().__init__("obsidian_get_recent_changes")
+        super().__init__(_RECENT_CHANGES_TOOL.name)
 
     def get_tool_description(self):
-        return Tool(
-            name=self.name,
-            description="Get recently modified files in the vault.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "limit": {
-                        "type": "integer",
-                        "description": "Maximum number of files to return (default: 10)",
-                        "default": 10,
-                        "minimum": 1,
-                        "maximum": 100
-                    },
-                    "days": {
-                        "type": "integer",
-                        "description": "Only include files modified within this many days (default: 90)",
-                        "minimum": 1,
-                        "default": 90
-                    }
-                }
-            }
-        )
+        return _RECENT_CHANGES_TOOL
 
     def run_tool(self, args: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
         limit = args.get("limit", 10)
@@ -730,507 +812,464 @@ class RecentChangesToolHandler(ToolHandler):
         backend = get_backend()
         results = backend.get_recent_changes(limit, days)
 
-        return [
-            TextContent(
-                type="text",
-                text=json.dumps(results, indent=2)
-            )
-        ]
+        return _text(_dumps(results))
+
+_FRONTMATTER_TOOL = Tool(
+    name="obsidian_frontmatter",
+    description="Manage frontmatter in Obsidian notes. Operations: read (get all frontmatter), update (merge fields), delete (remove field).",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "operation": {
+                "type": "string",
+                "description": "Operation to perform: read, update, or delete",
+                "enum": ["read", "update", "delete"]
+            },
+            "filepath": {
+                "type": "string",
+                "description": "Path to the file (relative to vault root)",
+                "format": "path"
+            },
+            "updates": {
+                "type": "object",
+                "description": "For 'update' operation: dictionary of fields to update"
+            },
+            "field": {
+                "type": "string",
+                "description": "For 'delete' operation: field name to delete"
+            }
+        },
+        "required": ["operation", "filepath"]
+    }
+)
 
 class FrontmatterToolHandler(ToolHandler):
+    _REQUIRED = frozenset({"operation", "filepath"})
+    _REQUIRED_BY_OPERATION = {
+        "update": frozenset({"updates"}),
+        "delete": frozenset({"field"}),
+    }
+
     def __init__(self):
-        super().__init__("obsidian_frontmatter")
+        super().__init__(_FRONTMATTER_TOOL.name)
 
     def get_tool_description(self):
-        return Tool(
-            name=self.name,
-            description="Manage frontmatter in Obsidian notes. Operations: read (get all frontmatter), update (merge fields), delete (remove field).",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "operation": {
-                        "type": "string",
-                        "description": "Operation to perform: read, update, or delete",
-                        "enum": ["read", "update", "delete"]
-                    },
-                    "filepath": {
-                        "type": "string",
-                        "description": "Path to the file (relative to vault root)",
-                        "format": "path"
-                    },
-                    "updates": {
-                        "type": "object",
-                        "description": "For 'update' operation: dictionary of fields to update"
-                    },
-                    "field": {
-                        "type": "string",
-                        "description": "For 'delete' operation: field name to delete"
-                    }
-                },
-                "required": ["operation", "filepath"]
-            }
-        )
+        return _FRONTMATTER_TOOL
 
     def run_tool(self, args: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
-        if "operation" not in args or "filepath" not in args:
-            raise RuntimeError("operation and filepath arguments required")
+        self._check_required(args)
 
         operation = args["operation"]
         filepath = args["filepath"]
-        api = obsidian.Obsidian(api_key=api_key, host=obsidian_host)
+        backend = get_backend()
 
         if operation == "read":
-            frontmatter = api.get_frontmatter(filepath)
-            return [
-                TextContent(
-                    type="text",
-                    text=json.dumps(frontmatter, indent=2)
-                )
-            ]
+            frontmatter = backend.get_frontmatter(filepath)
+            return _text(_dumps(frontmatter))
         elif operation == "update":
-            if "updates" not in args:
-                raise RuntimeError("updates argument required for update operation")
-            api.update_frontmatter(filepath, args["updates"])
-            return [
-                TextContent(
-                    type="text",
-                    text=f"Successfully updated frontmatter in {filepath}"
-                )
-            ]
+            backend.update_frontmatter(filepath, args["updates"])
+            _vault_written()
+            return _text(_FM_UPDATED_TEMPLATE.format(fp=filepath))
         elif operation == "delete":
-            if "field" not in args:
-                raise RuntimeError("field argument required for delete operation")
-            api.delete_frontmatter_field(filepath, args["field"])
-            return [
-                TextContent(
-                    type="text",
-                    text=f"Successfully deleted field '{args['field']}' from {filepath}"
-                )
-            ]
+            backend.delete_frontmatter_field(filepath, args["field"])
+            _vault_written()
+            return _text(_FM_FIELD_DELETED_TEMPLATE.format(field=args["field"], fp=filepath))
         else:
             raise RuntimeError(f"Unknown operation: {operation}")
 
+_TAG_TOOL = Tool(
+    name="obsidian_tags",
+    description="Work with tags in Obsidian. Operations: get_all (all unique tags), get_file_tags (tags from specific file), find_by_tags (files matching tags).",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "operation": {
+                "type": "string",
+                "description": "Operation to perform",
+                "enum": ["get_all", "get_file_tags", "find_by_tags"]
+            },
+            "filepath": {
+                "type": "string",
+                "description": "For 'get_file_tags': path to the file",
+                "format": "path"
+            },
+            "tags": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "For 'find_by_tags': list of tags to search for"
+            },
+            "match_all": {
+                "type": "boolean",
+                "description": "For 'find_by_tags': if true, file must have all tags (AND), if false any tag (OR)",
+                "default": False
+            }
+        },
+        "required": ["operation"]
+    }
+)
+
 class TagToolHandler(ToolHandler):
+    _REQUIRED = frozenset({"operation"})
+    _REQUIRED_BY_OPERATION = {
+        "get_file_tags": frozenset({"filepath"}),
+        "find_by_tags": frozenset({"tags"}),
+    }
+
     def __init__(self):
-        super().__init__("obsidian_tags")
+        super().__init__(_TAG_TOOL.name)
 
     def get_tool_description(self):
-        return Tool(
-            name=self.name,
-            description="Work with tags in Obsidian. Operations: get_all (all unique tags), get_file_tags (tags from specific file), find_by_tags (files matching tags).",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "operation": {
-                        "type": "string",
-                        "description": "Operation to perform",
-                        "enum": ["get_all", "get_file_tags", "find_by_tags"]
-                    },
-                    "filepath": {
-                        "type": "string",
-                        "description": "For 'get_file_tags': path to the file",
-                        "format": "path"
-                    },
-                    "tags": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "For 'find_by_tags': list of tags to search for"
-                    },
-                    "match_all": {
-                        "type": "boolean",
-                        "description": "For 'find_by_tags': if true, file must have all tags (AND), if false any tag (OR)",
-                        "default": False
-                    }
-                },
-                "required": ["operation"]
-            }
-        )
+        return _TAG_TOOL
 
     def run_tool(self, args: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
-        if "operation" not in args:
-            raise RuntimeError("operation argument required")
+        self._check_required(args)
 
         operation = args["operation"]
-        api = obsidian.Obsidian(api_key=api_key, host=obsidian_host)
+        backend = get_backend()
 
         if operation == "get_all":
-            tags = api.get_all_tags()
-            return [
-                TextContent(
-                    type="text",
-                    text=json.dumps({"tags": tags}, indent=2)
-                )
-            ]
+            tags = _listings.call(("get_all_tags",), backend.get_all_tags)
+            return _text(_dumps({"tags": tags}))
         elif operation == "get_file_tags":
-            if "filepath" not in args:
-                raise RuntimeError("filepath argument required for get_file_tags operation")
-            tags = api.get_tags_from_file(args["filepath"])
-            return [
-                TextContent(
-                    type="text",
-                    text=json.dumps({"filepath": args["filepath"], "tags": tags}, indent=2)
-                )
-            ]
+            tags = backend.get_tags_from_file(args["filepath"])
+            return _text(_dumps({"filepath": args["filepath"], "tags": tags}))
         elif operation == "find_by_tags":
-            if "tags" not in args:
-                raise RuntimeError("tags argument required for find_by_tags operation")
             match_all = args.get("match_all", False)
-            files = api.find_files_by_tags(args["tags"], match_all)
-            return [
-                TextContent(
-                    type="text",
-                    text=json.dumps({"files": files, "tags": args["tags"], "match_all": match_all}, indent=2)
-                )
-            ]
+            files = backend.find_files_by_tags(args["tags"], match_all)
+            return _text(_dumps({"files": files, "tags": args["tags"], "match_all": match_all}))
         else:
             raise RuntimeError(f"Unknown operation: {operation}")
 
+_ATTACHMENT_MANAGEMENT_TOOL = Tool(
+    name="obsidian_attachments",
+    description="Manage attachments in Obsidian. Operations: list (list files in attachments folder), rename (rename and update references), find_references (find files referencing an attachment).",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "operation": {
+                "type": "string",
+                "description": "Operation to perform",
+                "enum": ["list", "rename", "find_references"]
+            },
+            "folder_path": {
+                "type": "string",
+                "description": "For 'list': path to attachments folder",
+                "default": "attachments"
+            },
+            "filepath": {
+                "type": "string",
+                "description": "For 'rename' or 'find_references': path to the attachment"
+            },
+            "new_name": {
+                "type": "string",
+                "description": "For 'rename': new filename"
+            }
+        },
+        "required": ["operation"]
+    }
+)
+
 class AttachmentManagementToolHandler(ToolHandler):
+    _REQUIRED = frozenset({"operation"})
+    _REQUIRED_BY_OPERATION = {
+        "rename": frozenset({"filepath", "new_name"}),
+        "find_references": frozenset({"filepath"}),
+    }
+
     def __init__(self):
-        super().__init__("obsidian_attachments")
+        super().__init__(_ATTACHMENT_MANAGEMENT_TOOL.name)
 
     def get_tool_description(self):
-        return Tool(
-            name=self.name,
-            description="Manage attachments in Obsidian. Operations: list (list files in attachments folder), rename (rename and update references), find_references (find files referencing an attachment).",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "operation": {
-                        "type": "string",
-                        "description": "Operation to perform",
-                        "enum": ["list", "rename", "find_references"]
-                    },
-                    "folder_path": {
-                        "type": "string",
-                        "description": "For 'list': path to attachments folder",
-                        "default": "attachments"
-                    },
-                    "filepath": {
-                        "type": "string",
-                        "description": "For 'rename' or 'find_references': path to the attachment"
-                    },
-                    "new_name": {
-                        "type": "string",
-                        "description": "For 'rename': new filename"
-                    }
-                },
-                "required": ["operation"]
-            }
-        )
+        return _ATTACHMENT_MANAGEMENT_TOOL
 
     def run_tool(self, args: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
-        if "operation" not in args:
-            raise RuntimeError("operation argument required")
+        self._check_required(args)
 
         operation = args["operation"]
-        api = obsidian.Obsidian(api_key=api_key, host=obsidian_host)
+        backend = get_backend()
 
         if operation == "list":
             folder_path = args.get("folder_path", "attachments")
-            attachments = api.list_attachments(folder_path)
-            return [
-                TextContent(
-                    type="text",
-                    text=json.dumps({"folder": folder_path, "attachments": attachments}, indent=2)
-                )
-            ]
+            attachments = _listings.call(("list_attachments", folder_path), lambda: backend.list_attachments(folder_path))
+            return _text(_dumps({"folder": folder_path, "attachments": attachments}))
         elif operation == "rename":
-            if "filepath" not in args or "new_name" not in args:
-                raise RuntimeError("filepath and new_name arguments required for rename operation")
-            api.rename_attachment(args["filepath"], args["new_name"])
-            return [
-                TextContent(
-                    type="text",
-                    text=f"Successfully renamed {args['filepath']} to {args['new_name']}"
-                )
-            ]
+            backend.rename_attachment(args["filepath"], args["new_name"])
+            _vault_written()
+            return _text(_RENAMED_TEMPLATE.format(fp=args["filepath"], new_name=args["new_name"]))
         elif operation == "find_references":
-            if "filepath" not in args:
-                raise RuntimeError("filepath argument required for find_references operation")
-            references = api.find_attachment_references(args["filepath"])
-            return [
-                TextContent(
-                    type="text",
-                    text=json.dumps({"attachment": args["filepath"], "references": references}, indent=2)
-                )
-            ]
+            references = backend.find_attachment_references(args["filepath"])
+            return _text(_dumps({"attachment": args["filepath"], "references": references}))
         else:
             raise RuntimeError(f"Unknown operation: {operation}")
 
+_LINK_MANAGEMENT_TOOL = Tool(
+    name="obsidian_links",
+    description="Manage links in Obsidian. Operations: get_links (extract links from file), get_backlinks (find files linking to this file), update_links (update links when file is renamed).",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "operation": {
+                "type": "string",
+                "description": "Operation to perform",
+                "enum": ["get_links", "get_backlinks", "update_links"]
+            },
+            "filepath": {
+                "type": "string",
+                "description": "Path to the file",
+                "format": "path"
+            },
+            "old_path": {
+                "type": "string",
+                "description": "For 'update_links': old file path"
+            },
+            "new_path": {
+                "type": "string",
+                "description": "For 'update_links': new file path"
+            }
+        },
+        "required": ["operation"]
+    }
+)
+
 class LinkManagementToolHandler(ToolHandler):
+    _REQUIRED = frozenset({"operation"})
+    _REQUIRED_BY_OPERATION = {
+        "get_links": frozenset({"filepath"}),
+        "get_backlinks": frozenset({"filepath"}),
+        "update_links": frozenset({"old_path", "new_path"}),
+    }
+
     def __init__(self):
-        super().__init__("obsidian_links")
+        super().__init__(_LINK_MANAGEMENT_TOOL.name)
 
     def get_tool_description(self):
-        return Tool(
-            name=self.name,
-            description="Manage links in Obsidian. Operations: get_links (extract links from file), get_backlinks (find files linking to this file), update_links (update links when file is renamed).",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "operation": {
-                        "type": "string",
-                        "description": "Operation to perform",
-                        "enum": ["get_links", "get_backlinks", "update_links"]
-                    },
-                    "filepath": {
-                        "type": "string",
-                        "description": "Path to the file",
-                        "format": "path"
-                    },
-                    "old_path": {
-                        "type": "string",
-                        "description": "For 'update_links': old file path"
-                    },
-                    "new_path": {
-                        "type": "string",
-                        "description": "For 'update_links': new file path"
-                    }
-                },
-                "required": ["operation"]
-            }
-        )
+        return _LINK_MANAGEMENT_TOOL
 
     def run_tool(self, args: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
-        if "operation" not in args:
-            raise RuntimeError("operation argument required")
+        self._check_required(args)
 
         operation = args["operation"]
-        api = obsidian.Obsidian(api_key=api_key, host=obsidian_host)
+        backend = get_backend()
 
         if operation == "get_links":
-            if "filepath" not in args:
-                raise RuntimeError("filepath argument required for get_links operation")
-            links = api.get_links_in_file(args["filepath"])
-            return [
-                TextContent(
-                    type="text",
-                    text=json.dumps({"filepath": args["filepath"], "links": links}, indent=2)
-                )
-            ]
+            links = backend.get_links_in_file(args["filepath"])
+            return _text(_dumps({"filepath": args["filepath"], "links": links}))
         elif operation == "get_backlinks":
-            if "filepath" not in args:
-                raise RuntimeError("filepath argument required for get_backlinks operation")
-            backlinks = api.get_backlinks(args["filepath"])
-            return [
-                TextContent(
-                    type="text",
-                    text=json.dumps({"filepath": args["filepath"], "backlinks": backlinks}, indent=2)
-                )
-            ]
+            backlinks = backend.get_backlinks(args["filepath"])
+            return _text(_dumps({"filepath": args["filepath"], "backlinks": backlinks}))
         elif operation == "update_links":
-            if "old_path" not in args or "new_path" not in args:
-                raise RuntimeError("old_path and new_path arguments required for update_links operation")
-            count = api.update_links(args["old_path"], args["new_path"])
-            return [
-                TextContent(
-                    type="text",
-                    text=f"Successfully updated links in {count} files"
-                )
-            ]
+            count = backend.update_links(args["old_path"], args["new_path"])
+            _vault_written()
+            return _text(_LINKS_UPDATED_TEMPLATE.format(count=count))
         else:
             raise RuntimeError(f"Unknown operation: {operation}")
 
+_DATE_RANGE_TOOL = Tool(
+    name="obsidian_files_by_date",
+    description="Get files by date range. Supports relative dates like 'last 3 days' via days_back parameter.",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "days_back": {
+                "type": "integer",
+                "description": "Get files from last N days (alternative to start_date/end_date)",
+                "minimum": 1
+            },
+            "start_date": {
+                "type": "string",
+                "description": "Start date in ISO format (YYYY-MM-DD)"
+            },
+            "end_date": {
+                "type": "string",
+                "description": "End date in ISO format (YYYY-MM-DD)"
+            },
+            "folder_path": {
+                "type": "string",
+                "description": "Filter by folder path (empty for all)",
+                "default": ""
+            },
+            "include_content": {
+                "type": "boolean",
+                "description": "Whether to include file content",
+                "default": False
+            }
+        }
+    }
+)
+
 class DateRangeToolHandler(ToolHandler):
     def __init__(self):
-        super().__init__("obsidian_files_by_date")
+        super().__init__(_DATE_RANGE_TOOL.name)
 
     def get_tool_description(self):
-        return Tool(
-            name=self.name,
-            description="Get files by date range. Supports relative dates like 'last 3 days' via days_back parameter.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "days_back": {
-                        "type": "integer",
-                        "description": "Get files from last N days (alternative to start_date/end_date)",
-                        "minimum": 1
-                    },
-                    "start_date": {
-                        "type": "string",
-                        "description": "Start date in ISO format (YYYY-MM-DD)"
-                    },
-                    "end_date": {
-                        "type": "string",
-                        "description": "End date in ISO format (YYYY-MM-DD)"
-                    },
-                    "folder_path": {
-                        "type": "string",
-                        "description": "Filter by folder path (empty for all)",
-                        "default": ""
-                    },
-                    "include_content": {
-                        "type": "boolean",
-                        "description": "Whether to include file content",
-                        "default": False
-                    }
-                }
-            }
-        )
+        return _DATE_RANGE_TOOL
 
     def run_tool(self, args: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
-        api = obsidian.Obsidian(api_key=api_key, host=obsidian_host)
+        backend = get_backend()
         
-        files = api.get_files_by_date_range(
+        include_content = args.get("include_content", False)
+        files = backend.get_files_by_date_range(
             start_date=args.get("start_date"),
             end_date=args.get("end_date"),
             folder_path=args.get("folder_path", ""),
             days_back=args.get("days_back"),
-            include_content=args.get("include_content", False)
+            include_content=include_content
         )
 
-        return [
-            TextContent(
-                type="text",
-                text=json.dumps(files, indent=2)
-            )
-        ]
+        # With content, each file is its own block rather than one large JSON document
+        if include_content and files:
+            return _text_per_item(files)
+        return _text(_dumps(files))
+
+_PROGRESS_SUMMARY_TOOL = Tool(
+    name="obsidian_folder_progress",
+    description="Get progress summary for a folder. Shows all files changed in the last N days. Great for 'catch me up on last 3 days' queries.",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "folder_path": {
+                "type": "string",
+                "description": "Path to the folder"
+            },
+            "days_back": {
+                "type": "integer",
+                "description": "Number of days to look back (default: 3)",
+                "default": 3,
+                "minimum": 1
+            },
+            "include_content": {
+                "type": "boolean",
+                "description": "Whether to include file content (default: false)",
+                "default": False
+            }
+        },
+        "required": ["folder_path"]
+    }
+)
 
 class ProgressSummaryToolHandler(ToolHandler):
+    _REQUIRED = frozenset({"folder_path"})
+
     def __init__(self):
-        super().__init__("obsidian_folder_progress")
+        super().__init__(_PROGRESS_SUMMARY_TOOL.name)
 
     def get_tool_description(self):
-        return Tool(
-            name=self.name,
-            description="Get progress summary for a folder. Shows all files changed in the last N days. Great for 'catch me up on last 3 days' queries.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "folder_path": {
-                        "type": "string",
-                        "description": "Path to the folder"
-                    },
-                    "days_back": {
-                        "type": "integer",
-                        "description": "Number of days to look back (default: 3)",
-                        "default": 3,
-                        "minimum": 1
-                    },
-                    "include_content": {
-                        "type": "boolean",
-                        "description": "Whether to include file content (default: false)",
-                        "default": False
-                    }
-                },
-                "required": ["folder_path"]
-            }
-        )
+        return _PROGRESS_SUMMARY_TOOL
 
     def run_tool(self, args: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
-        if "folder_path" not in args:
-            raise RuntimeError("folder_path argument required")
+        self._check_required(args)
 
-        api = obsidian.Obsidian(api_key=api_key, host=obsidian_host)
+        backend = get_backend()
         
-        progress = api.get_folder_progress(
-            folder_path=args["folder_path"],
-            days_back=args.get("days_back", 3),
-            include_content=args.get("include_content", False)
+        folder_path = args["folder_path"]
+        days_back = args.get("days_back", 3)
+        include_content = args.get("include_content", False)
+        progress = _progress_cache.call(
+            ("get_folder_progress", folder_path, days_back, include_content),
+            lambda: backend.get_folder_progress(
+                folder_path=folder_path,
+                days_back=days_back,
+                include_content=include_content
+            )
         )
 
-        return [
-            TextContent(
-                type="text",
-                text=json.dumps(progress, indent=2)
-            )
-        ]
+        # With content, the summary comes first and each file follows as its own block
+        if include_content and progress["files"]:
+            summary = {key: value for key, value in progress.items() if key != "files"}
+            return _text(_dumps(summary)) + _text_per_item(progress["files"])
+        return _text(_dumps(progress))
+
+_FOLDER_TEMPLATE_TOOL = Tool(
+    name="obsidian_create_project",
+    description="Create a project folder with standardized structure inside the Projects/ folder. Templates: 'research_project' (creates Chats/, Research/, Daily Progress/ subfolders) or 'simple' (just index file).",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "base_path": {
+                "type": "string",
+                "description": "Project name or path. If it doesn't start with 'Projects/', it will be automatically prepended (e.g., 'My Research' becomes 'Projects/My Research')"
+            },
+            "template": {
+                "type": "string",
+                "description": "Template to use",
+                "enum": ["research_project", "simple"],
+                "default": "research_project"
+            }
+        },
+        "required": ["base_path"]
+    }
+)
 
 class FolderTemplateToolHandler(ToolHandler):
+    _REQUIRED = frozenset({"base_path"})
+
     def __init__(self):
-        super().__init__("obsidian_create_project")
+        super().__init__(_FOLDER_TEMPLATE_TOOL.name)
 
     def get_tool_description(self):
-        return Tool(
-            name=self.name,
-            description="Create a project folder with standardized structure inside the Projects/ folder. Templates: 'research_project' (creates Chats/, Research/, Daily Progress/ subfolders) or 'simple' (just index file).",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "base_path": {
-                        "type": "string",
-                        "description": "Project name or path. If it doesn't start with 'Projects/', it will be automatically prepended (e.g., 'My Research' becomes 'Projects/My Research')"
-                    },
-                    "template": {
-                        "type": "string",
-                        "description": "Template to use",
-                        "enum": ["research_project", "simple"],
-                        "default": "research_project"
-                    }
-                },
-                "required": ["base_path"]
-            }
-        )
+        return _FOLDER_TEMPLATE_TOOL
 
     def run_tool(self, args: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
-        if "base_path" not in args:
-            raise RuntimeError("base_path argument required")
+        self._check_required(args)
 
-        api = obsidian.Obsidian(api_key=api_key, host=obsidian_host)
+        backend = get_backend()
         
         # Automatically prepend "Projects/" if not already present
-        base_path = args["base_path"]
-        if not base_path.startswith("Projects/"):
-            base_path = f"Projects/{base_path}"
+        base_path = _in_projects(args["base_path"])
         
-        created = api.create_folder_structure(
+        created = backend.create_folder_structure(
             base_path=base_path,
             template=args.get("template", "research_project")
         )
-
-        return [
-            TextContent(
-                type="text",
-                text=json.dumps(created, indent=2)
-            )
-        ]
+        _vault_written()
+
+        return _text(_dumps(created))
+
+_DAILY_PROGRESS_NOTE_TOOL = Tool(
+    name="obsidian_create_daily_progress",
+    description="Create a daily progress note in a project's Daily Progress folder with the naming format daily_progress_YYYY_MM_DD.md. Perfect for tracking daily learnings and progress on a project.",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "project_path": {
+                "type": "string",
+                "description": "Path to the project (e.g., 'Projects/My Research' or just 'My Research' if it's in Projects/)"
+            },
+            "date": {
+                "type": "string",
+                "description": "Optional date in YYYY-MM-DD format. Defaults to today if not provided.",
+                "pattern": _ISO_DATE_PATTERN
+            }
+        },
+        "required": ["project_path"]
+    }
+)
 
 class DailyProgressNoteToolHandler(ToolHandler):
+    _REQUIRED = frozenset({"project_path"})
+
     def __init__(self):
-        super().__init__("obsidian_create_daily_progress")
+        super().__init__(_DAILY_PROGRESS_NOTE_TOOL.name)
 
     def get_tool_description(self):
-        return Tool(
-            name=self.name,
-            description="Create a daily progress note in a project's Daily Progress folder with the naming format daily_progress_YYYY_MM_DD.md. Perfect for tracking daily learnings and progress on a project.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "project_path": {
-                        "type": "string",
-                        "description": "Path to the project (e.g., 'Projects/My Research' or just 'My Research' if it's in Projects/)"
-                    },
-                    "date": {
-                        "type": "string",
-                        "description": "Optional date in YYYY-MM-DD format. Defaults to today if not provided.",
-                        "pattern": "^\\d{4}-\\d{2}-\\d{2}$"
-                    }
-                },
-                "required": ["project_path"]
-            }
-        )
+        return _DAILY_PROGRESS_NOTE_TOOL
 
     def run_tool(self, args: dict) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
-        if "project_path" not in args:
-            raise RuntimeError("project_path argument required")
+        self._check_required(args)
 
-        api = obsidian.Obsidian(api_key=api_key, host=obsidian_host)
+        date = args.get("date")
+        if date is not None and not (isinstance(date, str) and _ISO_DATE_RE.fullmatch(date)):
+            raise RuntimeError(f"Invalid date: {date}. Must be in YYYY-MM-DD format")
+
+        backend = get_backend()
         
         # Automatically prepend "Projects/" if not already present
-        project_path = args["project_path"]
-        if not project_path.startswith("Projects/"):
-            project_path = f"Projects/{project_path}"
+        project_path = _in_projects(args["project_path"])
         
-        file_path = api.create_daily_progress_note(
+        file_path = backend.create_daily_progress_note(
             project_path=project_path,
-            date=args.get("date")
+            date=date
         )
+        _vault_written()
 
-        return [
-            TextContent(
-                type="text",
-                text=f"Created daily progress note: {file_path}"
-            )
-        ]
+        return _text(_DAILY_PROGRESS_TEMPLATE.format(fp=file_path))
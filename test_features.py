@@ -1,23 +1,33 @@
 #!/usr/bin/env python3
-"""Quick test script for new features."""
+"""Quick test script for new features.
 
-import os
+Runs against a live vault (needs the Local REST API plugin and OBSIDIAN_API_KEY),
+so it is not part of the unit tests in tests/.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 
 # Load environment variables FIRST (before importing obsidian module)
 load_dotenv()
 
-from src.mcp_obsidian.obsidian import Obsidian
+from src.mcp_obsidian.obsidian import ObsidianAPIBackend
+from src.mcp_obsidian.server import Config
 
-api_key = os.getenv("OBSIDIAN_API_KEY")
-host = os.getenv("OBSIDIAN_HOST", "127.0.0.1")
+config = Config.from_env()
 
-if not api_key:
+if not config.api_key:
     print("Error: OBSIDIAN_API_KEY not set in .env file")
     exit(1)
 
 # Create API instance
-api = Obsidian(api_key=api_key, host=host)
+api = ObsidianAPIBackend(
+    api_key=config.api_key,
+    protocol=config.protocol,
+    host=config.host,
+    port=config.port,
+)
 
 print("=" * 60)
 print("Testing MCP Obsidian Thinking Partner Features")
@@ -53,42 +63,52 @@ try:
 except Exception as e:
     print(f"✗ Error: {e}")
 
-# Test 3: Tag operations
-print("\n3. Testing tag operations...")
-try:
+# Tests 3-5 only read the vault, so they run concurrently and report in order
+def run_tags():
     # Get tags from file
     tags = api.get_tags_from_file("Test Project/test.md")
-    print(f"✓ Tags from file: {tags}")
     
     # Get all tags in vault
     all_tags = api.get_all_tags()
-    print(f"✓ Total unique tags in vault: {len(all_tags)}")
-except Exception as e:
-    print(f"✗ Error: {e}")
+    return [f"✓ Tags from file: {tags}", f"✓ Total unique tags in vault: {len(all_tags)}"]
 
-# Test 4: Date range queries
-print("\n4. Testing date range queries...")
-try:
+def run_date_range():
     files = api.get_files_by_date_range(
         days_back=7,
         folder_path="Test Project",
         include_content=False
     )
-    print(f"✓ Files modified in last 7 days: {len(files)}")
-except Exception as e:
-    print(f"✗ Error: {e}")
+    return [f"✓ Files modified in last 7 days: {len(files)}"]
 
-# Test 5: Progress summary
-print("\n5. Testing progress summary...")
-try:
+def run_progress():
     progress = api.get_folder_progress(
         folder_path="Test Project",
         days_back=3,
         include_content=False
     )
-    print(f"✓ Progress summary: {progress['file_count']} files changed in last 3 days")
-except Exception as e:
-    print(f"✗ Error: {e}")
+    return [f"✓ Progress summary: {progress['file_count']} files changed in last 3 days"]
+
+read_tests = [
+    ("3. Testing tag operations...", run_tags),
+    ("4. Testing date range queries...", run_date_range),
+    ("5. Testing progress summary...", run_progress),
+]
+
+async def run_read_tests():
+    loop = asyncio.get_running_loop()
+    with ThreadPoolExecutor(max_workers=len(read_tests)) as executor:
+        return await asyncio.gather(
+            *(loop.run_in_executor(executor, run) for _, run in read_tests),
+            return_exceptions=True
+        )
+
+for (title, _), outcome in zip(read_tests, asyncio.run(run_read_tests())):
+    print(f"\n{title}")
+    if isinstance(outcome, Exception):
+        print(f"✗ Error: {outcome}")
+    else:
+        for line in outcome:
+            print(line)
 
 # Test 6: Links
 print("\n6. Testing link extraction...")
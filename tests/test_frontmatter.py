@@ -0,0 +1,34 @@
+"""Tests for the shared frontmatter helpers.
+
+Run with: python -m unittest discover tests (after `pip install -e .`)
+"""
+
+import unittest
+
+from mcp_obsidian.frontmatter import split_frontmatter
+from mcp_obsidian.obsidian import _frontmatter_from_content
+from mcp_obsidian.tools import _extract_frontmatter
+
+
+class SplitFrontmatterTest(unittest.TestCase):
+    def test_fences(self):
+        cases = {
+            "---\na: 1\n---\nbody": ("a: 1", "body"),
+            "--- \r\na: 1\r\n---  \r\nbody": ("a: 1", "body"),
+            "---\na: 1\n---": ("a: 1", ""),
+            "---\n---\nbody\n---\n": ("", "body\n---\n"),
+            "no frontmatter": (None, "no frontmatter"),
+            "---\na: 1\nnever closed": (None, "---\na: 1\nnever closed"),
+            "----\na: 1\n---\n": (None, "----\na: 1\n---\n"),
+        }
+        for content, expected in cases.items():
+            self.assertEqual(split_frontmatter(content), expected, content)
+
+    def test_readers_agree(self):
+        for content in ("---\na: 1\n---\n", "--- \na: 1\n---\t\n", "---\r\na: 1\r\n---\r\n", "---\na: 1\n---"):
+            self.assertEqual(_extract_frontmatter(content), {"a": 1}, content)
+            self.assertEqual(_frontmatter_from_content(content), {"a": 1}, content)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+"""Tests for the SQLite vault index.
+
+Run with: python -m unittest discover tests (after `pip install -e .`)
+"""
+
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from mcp_obsidian.index import MASK_TAG_COUNT, SCHEMA_VERSION, VaultIndex
+
+
+class VaultIndexTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self._tmp.name, "index.db")
+        self.index = VaultIndex(self.db_path)
+
+    def tearDown(self):
+        self.index._conn.close()
+        self._tmp.cleanup()
+
+    def add(self, path, tags=(), targets=(), attachments=(), mtime=1.0):
+        self.index.update_file(path, mtime, tags, targets, attachments)
+
+    def test_files_with_tags_any_and_all(self):
+        self.add("a.md", ["x", "y"])
+        self.add("b.md", ["y"])
+        self.add("c.md", [])
+
+        self.assertEqual(self.index.files_with_tags(["x", "y"]), ["a.md", "b.md"])
+        self.assertEqual(self.index.files_with_tags(["x", "y"], match_all=True), ["a.md"])
+        self.assertEqual(self.index.files_with_tags(["missing"], match_all=True), [])
+        self.assertEqual(self.index.files_with_tags([], match_all=True), ["a.md", "b.md", "c.md"])
+        self.assertEqual(self.index.files_with_tags([]), [])
+
+    def test_match_all_with_mask_and_tail_tags(self):
+        # More distinct tags than mask bits, so some are only in the tags table
+        tag_count = MASK_TAG_COUNT + 10
+        entries = []
+        for i in range(tag_count):
+            # Tag t{i} is on notes 0..(tag_count - i), so lower numbers are more common
+            for n in range(tag_count - i):
+                entries.append((f"n{n}.md", f"t{i}"))
+        notes = {}
+        for path, tag in entries:
+            notes.setdefault(path, set()).add(tag)
+        self.index.apply_changes([(path, 1.0, tags, (), ()) for path, tags in notes.items()], ())
+
+        mask_tag, tail_tag = "t0", f"t{tag_count - 1}"
+        self.assertIn(mask_tag, self.index._mask_bits)
+        self.assertNotIn(tail_tag, self.index._mask_bits)
+
+        for query in ([mask_tag], [tail_tag], [mask_tag, tail_tag], ["t5", "t70"], ["t3", "nope"]):
+            expected = sorted(path for path, tags in notes.items() if set(query) <= tags)
+            self.assertEqual(self.index.files_with_tags(query, match_all=True), expected, query)
+
+    def test_mask_uses_the_sign_bit(self):
+        notes = {f"n{n}.md": {f"t{i}" for i in range(MASK_TAG_COUNT) if i <= n} for n in range(MASK_TAG_COUNT)}
+        self.index.apply_changes([(path, 1.0, tags, (), ()) for path, tags in notes.items()], ())
+
+        last_bit_tag = next(tag for tag, bit in self.index._mask_bits.items() if bit == MASK_TAG_COUNT - 1)
+        expected = sorted(path for path, tags in notes.items() if last_bit_tag in tags)
+        self.assertEqual(self.index.files_with_tags([last_bit_tag, "t0"], match_all=True), expected)
+
+    def test_sources_linking_to(self):
+        self.add("a.md", targets=["target", "other"])
+        self.add("b.md", targets=["target"])
+        self.add("c.md", targets=["other"])
+
+        self.assertEqual(self.index.sources_linking_to("target"), ["a.md", "b.md"])
+        self.assertEqual(self.index.sources_linking_to("nothing"), [])
+
+    def test_sources_referencing(self):
+        self.add("a.md", attachments=["img.png"])
+        self.add("b.md", targets=["img.png"])
+        self.add("c.md", targets=["img"])
+
+        self.assertEqual(self.index.sources_referencing("img.png"), ["a.md", "b.md"])
+
+    def test_update_file_replaces_rows(self):
+        self.add("a.md", ["x"], ["target"], ["img.png"], mtime=1.0)
+        self.add("a.md", ["y"], ["elsewhere"], (), mtime=2.0)
+
+        self.assertEqual(self.index.files_with_tags(["x"]), [])
+        self.assertEqual(self.index.files_with_tags(["y"], match_all=True), ["a.md"])
+        self.assertEqual(self.index.sources_linking_to("target"), [])
+        self.assertEqual(self.index.sources_linking_to("elsewhere"), ["a.md"])
+        self.assertEqual(self.index.sources_referencing("img.png"), [])
+        self.assertEqual(self.index.mtimes(), {"a.md": 2.0})
+
+    def test_remove_file(self):
+        self.add("a.md", ["x"], ["target"], ["img.png"])
+        self.add("b.md", ["x"])
+
+        self.index.remove_file("a.md")
+
+        self.assertEqual(self.index.paths(), {"b.md"})
+        self.assertEqual(self.index.files_with_tags(["x"], match_all=True), ["b.md"])
+        self.assertEqual(self.index.sources_linking_to("target"), [])
+        self.assertEqual(self.index.sources_referencing("img.png"), [])
+
+    def test_state_persists_across_connections(self):
+        self.add("a.md", ["x"], mtime=3.5)
+        self.index._conn.close()
+
+        self.index = VaultIndex(self.db_path)
+        self.assertEqual(self.index.mtimes(), {"a.md": 3.5})
+        self.assertEqual(self.index.files_with_tags(["x"], match_all=True), ["a.md"])
+
+    def test_outdated_schema_is_rebuilt(self):
+        self.index._conn.close()
+        os.remove(self.db_path)
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("CREATE TABLE files (path TEXT PRIMARY KEY)")
+        conn.execute("INSERT INTO files (path) VALUES ('old.md')")
+        conn.commit()
+        conn.close()
+
+        self.index = VaultIndex(self.db_path)
+        self.assertEqual(self.index.mtimes(), {})
+        self.assertEqual(self.index._conn.execute("PRAGMA user_version").fetchone()[0], SCHEMA_VERSION)
+
+
+if __name__ == "__main__":
+    unittest.main()
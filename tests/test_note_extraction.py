@@ -0,0 +1,36 @@
+"""Tests for reusing tag/link extraction results of ETag-cached notes.
+
+Run with: python -m unittest discover tests (after `pip install -e .`)
+"""
+
+import unittest
+from unittest import mock
+
+from mcp_obsidian import obsidian
+
+
+class ExtractTest(unittest.TestCase):
+    def setUp(self):
+        self.backend = obsidian.ObsidianAPIBackend(api_key="test")
+        self.extractor = mock.Mock(side_effect=obsidian._extract_tags)
+
+    def test_cached_body_is_parsed_once(self):
+        content = "#x"
+        self.backend._content_cache["a.md"] = ("etag", content, {})
+
+        self.assertEqual(self.backend._extract("a.md", content, self.extractor), ("x",))
+        self.assertEqual(self.backend._extract("a.md", content, self.extractor), ("x",))
+        self.assertEqual(self.extractor.call_count, 1)
+
+    def test_other_bodies_are_parsed_every_time(self):
+        self.backend._content_cache["a.md"] = ("etag", "#x", {})
+
+        # A body fetched without an ETag, or one that replaced the cached body
+        self.assertEqual(self.backend._extract("b.md", "#y", self.extractor), ("y",))
+        self.assertEqual(self.backend._extract("a.md", "#z", self.extractor), ("z",))
+        self.assertEqual(self.backend._extract("a.md", "#z", self.extractor), ("z",))
+        self.assertEqual(self.extractor.call_count, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+"""Tests for how the API backend keeps its vault index and note names in sync.
+
+Run with: python -m unittest discover tests (after `pip install -e .`)
+"""
+
+import tempfile
+import unittest
+from unittest import mock
+
+from mcp_obsidian import obsidian
+
+
+class FakeVaultBackend(obsidian.ObsidianAPIBackend):
+    """API backend over an in-memory vault of {path: (mtime, content)}."""
+
+    def __init__(self, vault):
+        self.vault = vault
+        self.reads = []
+        super().__init__(api_key="test")
+
+    def get_file_contents(self, filepath):
+        self.reads.append(filepath)
+        if filepath not in self.vault:
+            raise Exception("Error 40400: Not Found")
+        return self.vault[filepath][1]
+
+    def search_json(self, query):
+        return [{"filename": path, "result": mtime} for path, (mtime, _) in self.vault.items()]
+
+
+class IndexSyncTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        patch = mock.patch.object(obsidian, "VAULT_INDEX_DIR", self._tmp.name)
+        patch.start()
+        self.addCleanup(patch.stop)
+        self.vault = {
+            "a.md": (1, "#x links to [[b]]"),
+            "b.md": (1, "#y ![[img.png]]"),
+        }
+        self.backend = FakeVaultBackend(self.vault)
+
+    def tearDown(self):
+        if self.backend._index is not None:
+            self.backend._index._conn.close()
+        self._tmp.cleanup()
+
+    def test_first_query_reads_every_note(self):
+        self.assertEqual(self.backend.find_files_by_tags(["x"]), ["a.md"])
+        self.assertEqual(self.backend.get_backlinks("b.md"), ["a.md"])
+        self.assertEqual(self.backend.find_attachment_references("attachments/img.png"), ["b.md"])
+        self.assertEqual(sorted(self.backend.reads), ["a.md", "b.md"])
+
+    def test_unchanged_notes_are_not_reread(self):
+        self.backend.find_files_by_tags(["x"])
+        self.backend.reads.clear()
+
+        self.backend.find_files_by_tags(["y"])
+        self.assertEqual(self.backend.reads, [])
+
+    def test_external_edit_is_picked_up(self):
+        self.backend.find_files_by_tags(["x"])
+        self.backend.reads.clear()
+
+        self.vault["b.md"] = (2, "#x now, no links")
+        self.assertEqual(self.backend.find_files_by_tags(["x"]), ["a.md", "b.md"])
+        self.assertEqual(self.backend.find_attachment_references("img.png"), [])
+        self.assertEqual(self.backend.reads, ["b.md"])
+
+    def test_added_and_removed_notes(self):
+        self.backend.find_files_by_tags(["x"])
+
+        del self.vault["a.md"]
+        self.vault["c.md"] = (1, "#x [[b]]")
+        self.assertEqual(self.backend.find_files_by_tags(["x"]), ["c.md"])
+        self.assertEqual(self.backend.get_backlinks("b.md"), ["c.md"])
+
+    def test_reopened_index_is_synced_before_answering(self):
+        self.backend.find_files_by_tags(["x"])
+        self.backend._index._conn.close()
+
+        self.vault["a.md"] = (5, "#z")
+        reopened = FakeVaultBackend(self.vault)
+        try:
+            self.assertEqual(reopened.find_files_by_tags(["x"]), [])
+            self.assertEqual(reopened.reads, ["a.md"])
+        finally:
+            reopened._index._conn.close()
+        self.backend._index = None
+
+    def test_link_names_are_relisted_after_max_age(self):
+        self.assertFalse(self.backend._link_target_exists("c"))
+        self.vault["c.md"] = (1, "")
+        self.assertFalse(self.backend._link_target_exists("c"))
+
+        with mock.patch.object(obsidian, "RESOLVABLE_NAMES_MAX_AGE", 0):
+            self.assertTrue(self.backend._link_target_exists("c"))
+
+    def test_index_sync_refreshes_link_names(self):
+        self.assertFalse(self.backend._link_target_exists("c"))
+        self.vault["c.md"] = (1, "")
+
+        self.backend.find_files_by_tags(["x"])
+        self.assertTrue(self.backend._link_target_exists("c"))
+
+
+if __name__ == "__main__":
+    unittest.main()